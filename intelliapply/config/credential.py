@@ -4,17 +4,59 @@ Manages configuration files with cross-platform support.
 """
 
 import os
+import re
 import sys
+import json
+import shlex
 import shutil
+import functools
 import platform
 import subprocess
+import threading
 from pathlib import Path
 from typing import Dict, Any
 from urllib.parse import urlparse
 import yaml
 
+try:
+    # LibYAML-backed loader, parses in C
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from intelliapply.utils.print_utils import print_
 
+# Host OS, resolved once per process
+_SYSTEM = platform.system()
+
+# Placeholder values left over from credential-example.yaml
+_PLACEHOLDER_RE = re.compile(r'xxxx|/path/to/', re.IGNORECASE)
+
+
+def _stat_or_none(path):
+    """Return os.stat() of path, or None if it does not exist (one syscall for existence and mtime)."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+@functools.cache
+def _find_linux_opener():
+    """
+    Find how to open a file on Linux (looked up once per process).
+
+    Returns:
+        (command, is_terminal_editor) for xdg-open or the user's $EDITOR, or None if neither is available
+    """
+    xdg_open = shutil.which("xdg-open")
+    if xdg_open:
+        return [xdg_open], False
+    editor = os.environ.get("EDITOR", "").strip()
+    if editor:
+        return shlex.split(editor), True
+    return None
+
 
 class ConfigManager:
     """Manages configuration files in user's home directory."""
@@ -22,11 +64,35 @@ class ConfigManager:
     # Config directory name in user's home folder
     CONFIG_DIR_NAME = "intelliApply_config"
     CONFIG_FILE_NAME = "config.yaml"
+    CONFIG_CACHE_FILE_NAME = "config.yaml.cache.json"
+
+    # Checks applied to every API service, in order: (field, check on the stripped value, error message)
+    SERVICE_CHECKS = (
+        ('api_key', bool, "api_key is empty"),
+        ('api_key', lambda value: not _PLACEHOLDER_RE.search(value), "api_key contains placeholder value"),
+        ('base_url', bool, "base_url is empty"),
+        ('base_url', lambda value: ConfigManager._is_valid_url(value), "base_url is not a valid URL: {value}"),
+        ('model', bool, "model is empty"),
+        ('reasoning_effort', lambda value: value in ('', 'none', 'low', 'medium', 'high'),
+         "reasoning_effort must be one of: none, low, medium, high"),
+    )
+
+    # Path settings that must be filled in
+    PATH_FIELDS = ('excel_file_path', 'backup_folder_path')
 
     def __init__(self):
-        """Initialize config manager and ensure config exists."""
+        """Initialize config manager paths. Does no I/O; see ensure_configured()."""
         self.config_dir = self._get_config_dir()
         self.config_file = self.config_dir / self.CONFIG_FILE_NAME
+        self.config_cache_file = self.config_dir / self.CONFIG_CACHE_FILE_NAME
+        self._cached_config = None
+        self._cached_config_mtime = None
+
+    def ensure_configured(self) -> None:
+        """
+        Interactive setup: create the config from the template on first run
+        (waiting for the user to edit it), then validate it.
+        """
         self._ensure_config_exists()
         self._ensure_config_valid()
 
@@ -59,12 +125,12 @@ class ConfigManager:
         If first time, copy template and prompt user to edit.
         """
         # Create config directory if it doesn't exist
-        if not self.config_dir.exists():
+        if _stat_or_none(self.config_dir) is None:
             self.config_dir.mkdir(parents=True, exist_ok=True)
             print_(f"Created config directory: {self.config_dir}", "GREEN")
 
         # Check if config file exists
-        if not self.config_file.exists():
+        if _stat_or_none(self.config_file) is None:
             self._create_config_from_template()
             self._open_config_file()
             print_("\n" + "=" * 60)
@@ -80,7 +146,7 @@ class ConfigManager:
 
     def _ensure_config_valid(self) -> None:
         """
-        Ensure the configuration is valid.
+        Ensure the configuration is valid, exiting the CLI if it is not.
         """
         if not self._validate_config():
             print_("\nERROR: Configuration is invalid or incomplete!", "RED")
@@ -97,25 +163,29 @@ class ConfigManager:
         if not template_path.exists():
             raise FileNotFoundError(f"Template file not found: {template_path}")
 
-        # Copy template to user config directory
-        shutil.copy(template_path, self.config_file)
+        # Copy template bytes only (not its mode): the file will hold API keys, so keep it owner-only
+        shutil.copyfile(template_path, self.config_file)
+        os.chmod(self.config_file, 0o600)
 
     def _open_config_file(self) -> None:
         """Open config file with default system editor."""
         try:
-            system = platform.system()
+            system = _SYSTEM
 
             if system == "Darwin":  # macOS
-                subprocess.run(["open", str(self.config_file)])
+                subprocess.Popen(["open", str(self.config_file)], start_new_session=True)
             elif system == "Windows":
                 os.startfile(str(self.config_file))
             elif system == "Linux":
-                # Try common Linux editors
-                editors = ["xdg-open", "gedit", "kate", "nano", "vim"]
-                for editor in editors:
-                    if shutil.which(editor):
-                        subprocess.run([editor, str(self.config_file)])
-                        break
+                opener = _find_linux_opener()
+                if opener is None:
+                    print_(f"Please manually open and edit: {self.config_file}", "YELLOW")
+                elif opener[1]:
+                    # $EDITOR runs in this terminal, so wait for it to exit
+                    subprocess.run(opener[0] + [str(self.config_file)])
+                else:
+                    # Desktop handler: don't hold the CLI while it is open
+                    subprocess.Popen(opener[0] + [str(self.config_file)], start_new_session=True)
             else:
                 print_(f"Please manually open and edit: {self.config_file}", "YELLOW")
         except Exception as e:
@@ -124,11 +194,31 @@ class ConfigManager:
 
     def _validate_config(self) -> bool:
         """
-        Validate the configuration file.
+        Validate the configuration file, printing the problem found (if any)
+        and warning about experimental models.
 
         Returns:
             True if valid, False otherwise
         """
+        error = self._find_config_error()
+        if error:
+            print_(error, "RED")
+            return False
+
+        # Experimental models carry much lower rate limits and may be withdrawn
+        for idx, service in enumerate(self.get_api_services(), 1):
+            model = str(service['model']).strip()
+            if model.endswith('-exp') or '-exp-' in model:
+                print_(f"Warning: Service {idx} - {model} is an experimental model with reduced rate limits", "YELLOW")
+        return True
+
+    def _find_config_error(self):
+        """
+        Check the configuration file without printing errors or exiting.
+
+        Returns:
+            The first error message found, or None if the config is valid
+        """
         try:
             config = self.load_config()
 
@@ -137,62 +227,31 @@ class ConfigManager:
 
             # Validate API services exist
             if not api_services:
-                print_("Error: No API services configured", "RED")
-                return False
+                return "Error: No API services configured"
             
             # Validate each service
             for idx, service in enumerate(api_services, 1):
-                # Check required fields are not empty
-                api_key = service.get('api_key', '').strip()
-                base_url = service.get('base_url', '').strip()
-                model = service.get('model', '').strip()
-                reasoning_effort = service.get('reasoning_effort', '').strip()
-                
-                # Validate api_key
-                if not api_key:
-                    print_(f"Error: Service {idx} - api_key is empty", "RED")
-                    return False
-                if 'xxxx' in api_key.lower():
-                    print_(f"Error: Service {idx} - api_key contains placeholder value", "RED")
-                    return False
-                
-                # Validate base_url
-                if not base_url:
-                    print_(f"Error: Service {idx} - base_url is empty", "RED")
-                    return False
-                if not self._is_valid_url(base_url):
-                    print_(f"Error: Service {idx} - base_url is not a valid URL: {base_url}", "RED")
-                    return False
-                
-                # Validate model
-                if not model:
-                    print_(f"Error: Service {idx} - model is empty", "RED")
-                    return False
-                
-                # Validate reasoning_effort (optional field)
-                if reasoning_effort and reasoning_effort not in ['none', 'low', 'medium', 'high']:
-                    print_(f"Error: Service {idx} - reasoning_effort must be one of: none, low, medium, high", "RED")
-                    return False
-
-            # Check paths section
-            paths = config.get('paths', {})
-            excel_path = paths.get('excel_file_path', '').strip()
-            backup_path = paths.get('backup_folder_path', '').strip()
+                for field, check, message in self.SERVICE_CHECKS:
+                    value = str(service.get(field) or '').strip()
+                    if not check(value):
+                        return f"Error: Service {idx} - {message.format(value=value)}"
+
+                # Validate max_requests_per_minute (optional field)
+                rpm = service.get('max_requests_per_minute')
+                if rpm is not None and (isinstance(rpm, bool) or not isinstance(rpm, (int, float)) or rpm <= 0):
+                    return f"Error: Service {idx} - max_requests_per_minute must be a positive number"
 
             # Validate paths are not empty or placeholder
-            if not excel_path or '/path/to/' in excel_path:
-                print_("Error: excel_file_path is empty or contains placeholder", "RED")
-                return False
-            
-            if not backup_path or '/path/to/' in backup_path:
-                print_("Error: backup_folder_path is empty or contains placeholder", "RED")
-                return False
+            paths = config.get('paths', {})
+            for field in self.PATH_FIELDS:
+                path = str(paths.get(field) or '').strip()
+                if not path or _PLACEHOLDER_RE.search(path):
+                    return f"Error: {field} is empty or contains placeholder"
 
-            return True
+            return None
 
         except Exception as e:
-            print_(f"Config validation error: {e}", "RED")
-            return False
+            return f"Config validation error: {e}"
     
     @staticmethod
     def _is_valid_url(url: str) -> bool:
@@ -215,6 +274,7 @@ class ConfigManager:
     def load_config(self) -> Dict[str, Any]:
         """
         Load configuration from YAML file.
+        The parsed config is cached and only re-read when the file's mtime changes.
 
         Returns:
             Dictionary containing configuration
@@ -223,14 +283,64 @@ class ConfigManager:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If YAML parsing fails
         """
-        if not self.config_file.exists():
+        stat = _stat_or_none(self.config_file)
+        if stat is None:
             raise FileNotFoundError(f"Config file not found: {self.config_file}")
 
-        with open(self.config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        mtime = stat.st_mtime
+        if self._cached_config is not None and mtime == self._cached_config_mtime:
+            return self._cached_config
 
+        config = self._read_config_cache(mtime)
+        if config is None:
+            # Hand raw bytes to the loader; it detects and decodes UTF-8 itself
+            config = yaml.load(self.config_file.read_bytes(), Loader=SafeLoader)
+            self._write_config_cache(config, mtime)
+
+        self._cached_config = config
+        self._cached_config_mtime = mtime
         return config
 
+    def _read_config_cache(self, mtime: float):
+        """
+        Read the parsed config from the JSON sidecar if it was written for this YAML mtime.
+
+        Args:
+            mtime: Current modification time of the YAML config file
+
+        Returns:
+            Cached config dictionary, or None if the sidecar is missing or stale
+        """
+        try:
+            cache = json.loads(self.config_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get('mtime') != mtime:
+            return None
+        return cache.get('config')
+
+    def _write_config_cache(self, config: Dict[str, Any], mtime: float) -> None:
+        """
+        Atomically write the parsed config to the JSON sidecar, readable by the owner only.
+
+        Args:
+            config: Parsed config dictionary
+            mtime: Modification time of the YAML file it was parsed from
+        """
+        tmp_path = self.config_cache_file.with_name(f"{self.config_cache_file.name}.{os.getpid()}.tmp")
+        try:
+            payload = json.dumps({'mtime': mtime, 'config': config})
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.config_cache_file)
+        except (OSError, TypeError, ValueError):
+            # The sidecar is only an optimization; fall back to parsing YAML next time
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def get_api_services(self) -> list:
         """Get API services list."""
         config = self.load_config()
@@ -242,13 +352,44 @@ class ConfigManager:
         return config.get('paths', {})
 
 
-# Initialize global config manager
-_config_manager = ConfigManager()
-_api_services = _config_manager.get_api_services()
-_paths_config = _config_manager.get_paths_config()
-
-# Export configuration variables
-API_SERVICES = _api_services
-
-EXCEL_FILE_PATH = _paths_config.get('excel_file_path', '')
-BACKUP_FOLDER_PATH = _paths_config.get('backup_folder_path', '')
+def ensure_configured() -> None:
+    """
+    Run first-time setup and validate the config. Called by the CLI entry point
+    before anything reads the exported configuration variables.
+    """
+    ConfigManager().ensure_configured()
+
+
+# Exported configuration variables, resolved lazily on first access (PEP 562)
+_EXPORTED_NAMES = ('API_SERVICES', 'EXCEL_FILE_PATH', 'BACKUP_FOLDER_PATH')
+_exports_lock = threading.Lock()
+
+
+def __getattr__(name):
+    """Load the config on first access to an exported variable, then cache it as a module global."""
+    if name not in _EXPORTED_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _exports_lock:
+        if name not in globals():
+            config_manager = ConfigManager()
+            # Never prompt from here: only the CLI entry point runs interactive setup
+            if _stat_or_none(config_manager.config_file) is None:
+                raise FileNotFoundError(
+                    f"Config file not found: {config_manager.config_file}. "
+                    f"Run intelliapply once (or call ensure_configured()) to create it."
+                )
+            # Raise instead of exiting: importers get an exception they can handle
+            error = config_manager._find_config_error()
+            if error:
+                raise ValueError(f"Invalid configuration in {config_manager.config_file}: {error}")
+
+            # One load shared by all exports (the same cached parse validation used)
+            config = config_manager.load_config()
+            paths_config = config.get('paths', {})
+            globals().update(
+                API_SERVICES=config.get('api_services', []),
+                EXCEL_FILE_PATH=paths_config.get('excel_file_path', ''),
+                BACKUP_FOLDER_PATH=paths_config.get('backup_folder_path', ''),
+            )
+    return globals()[name]
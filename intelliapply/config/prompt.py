@@ -1,3 +1,5 @@
+import json
+
 from pydantic import BaseModel
 
 REQUIRED_FIELDS = ["Company", "Location", "Job Title"]
@@ -42,6 +44,10 @@ SYSTEM_PROMPT = """
 }
 """
 
+# Send the prompt as compact JSON: fewer input tokens per request, and an identical
+# system-message prefix on every call so providers can apply their implicit prompt caching
+SYSTEM_PROMPT = json.dumps(json.loads(SYSTEM_PROMPT), separators=(",", ":"), ensure_ascii=False)
+
 
 class JobInfo(BaseModel):
     isValid: bool
@@ -54,3 +60,33 @@ class JobInfo(BaseModel):
 
     def __str__(self):
         return f"isValid: {self.isValid}, Company: {self.Company}, Location: {self.Location}, Job Title: {self.Job_Title}, Code: {self.Code}, Type: {self.Type}, Link: {self.Link}"
+
+    def to_dict(self):
+        """Convert to a result dictionary using Excel field names (Job_Title -> Job Title)."""
+        return {
+            "isValid": self.isValid,
+            "Company": self.Company,
+            "Location": self.Location,
+            "Job Title": self.Job_Title,
+            "Code": self.Code,
+            "Type": self.Type,
+            "Link": self.Link
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a result dictionary using Excel field names (Job Title -> Job_Title)."""
+        return cls(
+            isValid=data.get('isValid', False),
+            Company=data.get('Company', ''),
+            Location=data.get('Location', ''),
+            Job_Title=data.get('Job Title', ''),
+            Code=data.get('Code', ''),
+            Type=data.get('Type', ''),
+            Link=data.get('Link', '')
+        )
+
+
+def parse_job_info(raw):
+    """Validate a raw JSON string straight into JobInfo (no intermediate dict)."""
+    return JobInfo.model_validate_json(raw)
@@ -9,6 +9,7 @@ import time
 import signal
 import sys
 
+from intelliapply.config.credential import ensure_configured
 from intelliapply.utils.string_utils import is_markdown_table, parse_markdown_table, is_json
 from intelliapply.utils.excel_utils import ExcelManager
 from intelliapply.utils.print_utils import print_, print_results, COLOR
@@ -61,7 +62,7 @@ def detect_ending(min_threshold=0.05, max_threshold=0.5):
 
 
 DEFAULT_PROMPT = f"""Search: Enter keywords or initials
-Add new record: Enter one-line JSON data / URL / webpage content (wrapped with '< >' or '```')
+Add new record: Enter one-line JSON data / URL(s) / webpage content (wrapped with '< >' or '```')
 Other commands: {COLOR['BOLD_ITALIC']}delete{COLOR['RESET']} last record, update {COLOR['BOLD_ITALIC']}cookie{COLOR['RESET']}, view statistics {COLOR['BOLD_ITALIC']}summary{COLOR['RESET']}, {COLOR['BOLD_ITALIC']}open{COLOR['RESET']} Excel file, {COLOR['BOLD_ITALIC']}exit{COLOR['RESET']} tool"""
 
 UPDATE_PROMPT = f"""Update status: Enter number+action (e.g. 1r=line 1 as reject, 2p=line 2 as processing, 3o=line 3 as offer)"""
@@ -71,6 +72,9 @@ def main():
     # Set up signal handler for SIGINT
     signal.signal(signal.SIGINT, signal_handler)
 
+    # First-run setup and config validation (may wait for the user to edit the config)
+    ensure_configured()
+
     # Clear the console
     os.system('cls' if os.name == 'nt' else 'clear')
 
@@ -1,27 +1,62 @@
 import re
+import atexit
+import bisect
 import functools
+import hashlib
+import queue
 import threading
 from openpyxl import load_workbook, Workbook
 from openpyxl.styles import PatternFill
+import numpy as np
 import pandas as pd
 import os
+import platform
 import shutil
+import subprocess
 import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
 from datetime import datetime
 
 from intelliapply.utils.print_utils import print_, print_results
-from intelliapply.utils.string_utils import normalize_company_name, get_abbreviation_lower, cleaned_string
-from intelliapply.config.credential import EXCEL_FILE_PATH
+from intelliapply.utils.string_utils import normalize_company_name, get_abbreviation_lower, cleaned_string, \
+    cleaned_series, normalize_company_series
+from intelliapply.config import credential
 from intelliapply.config.prompt import ALL_FIELDS
 
 
+try:
+    # Rust-backed reader, much faster than openpyxl for value-only reads
+    import python_calamine  # noqa: F401
+    _READ_ENGINE = 'calamine'
+except ImportError:
+    _READ_ENGINE = 'openpyxl'
+
+# OOXML namespaces used when scanning the xlsx package directly
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_DOC_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_CELL_REF_RE = re.compile(r'([A-Z]+)(\d+)')
+
+# A job title search term that is a single word can be answered from the token index
+_WORD_RE = re.compile(r'\w+')
+
+# Command used by open_excel_file, resolved once per process (None: use os.startfile on Windows)
+_FILE_OPENER = {'Darwin': 'open', 'Windows': None}.get(platform.system(), 'xdg-open')
+
+
 def sync(func):
     """Decorator: auto call _sync_data() before function execution."""
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         if hasattr(self, "_sync_data"):
-            self._sync_data()
+            # Wait out an in-flight save so its own write isn't mistaken for an external change
+            with self._workbook_lock:
+                self._sync_data()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._mtime_this_tick = None
         return func(self, *args, **kwargs)
 
     return wrapper
@@ -32,11 +67,12 @@ def save(func):
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        result = func(self, *args, **kwargs)
-        if hasattr(self, "_save_data"):
-            # Start async save in background thread
-            save_thread = threading.Thread(target=self._save_data, daemon=True)
-            save_thread.start()
+        # Don't edit the workbook while the writer thread is serializing it
+        with self._workbook_lock:
+            result = func(self, *args, **kwargs)
+        if hasattr(self, "_request_save"):
+            # Hand the save to the background writer thread
+            self._request_save()
         return result
 
     return wrapper
@@ -55,6 +91,22 @@ class ExcelManager:
         'OFFER': 'FF00FF00'  # Green
     }
 
+    # Reverse lookup used when scanning Status cell colors
+    COLOR_STATUSES = {color: status for status, color in STATUS_COLORS.items()}
+
+    # _internal_status is a categorical column over these values
+    STATUS_CATEGORIES = ['REJECTED', 'PROCESSING', 'OFFER', 'NONE']
+    COLOR_STATUS_CODES = {color: code for code, color in enumerate(map(STATUS_COLORS.get, STATUS_CATEGORIES)) if color}
+
+    # On-disk cache of parsed sheets (values, statuses, search columns), keyed by path, mtime and size
+    DF_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'intelliapply')
+    DF_CACHE_MAX_FILES = 16
+    # Bump when the cached columns change (e.g. search normalization) to invalidate old entries
+    DF_CACHE_VERSION = 4
+
+    # Pre-edit backups in the system temp directory
+    BACKUP_PREFIX = 'job_application_backup_'
+
     STATUS_SYMBOLS = {
         'REJECTED': '  ⨉  ',
         'PROCESSING': '  →  ',
@@ -69,13 +121,22 @@ class ExcelManager:
         Args:
             file_path: Path to the Excel file (defaults to EXCEL_FILE_PATH from config)
         """
-        self.file_path = file_path or EXCEL_FILE_PATH
+        self.file_path = file_path or credential.EXCEL_FILE_PATH
         if not self.validate_excel_file():
             print_("Excel file is invalid. Please check the file and try again.", "RED")
             exit(1)
         self._cached_df = None
+        self._search_index = None
+        self._pending_rows = []
+        self._row_count = None  # Last used sheet row (header included), tracked instead of sheet.max_row
         self._cached_workbook = None
+        self._headers = None
         self._last_mtime = 0.0
+        self._mtime_this_tick = None  # mtime stat'ed by the current @sync operation
+        self._session_backup_done = False
+        self._save_queue = queue.Queue()
+        self._save_thread = None
+        self._workbook_lock = threading.RLock()
 
     def _color_to_status(self, color_rgb):
         """
@@ -87,14 +148,7 @@ class ExcelManager:
         Returns:
             Status string ('REJECTED', 'PROCESSING', 'OFFER', or 'NONE')
         """
-        if color_rgb == self.STATUS_COLORS['REJECTED']:
-            return 'REJECTED'
-        elif color_rgb == self.STATUS_COLORS['PROCESSING']:
-            return 'PROCESSING'
-        elif color_rgb == self.STATUS_COLORS['OFFER']:
-            return 'OFFER'
-        else:
-            return 'NONE'
+        return self.COLOR_STATUSES.get(color_rgb, 'NONE')
 
     def _status_to_symbol(self, status):
         """
@@ -121,77 +175,464 @@ class ExcelManager:
         Automatically decides whether to invalidate cache based on file mtime.
         No return value - updates internal cache state only.
         """
-        current_mtime = self._get_current_mtime()
+        current_mtime = self._mtime_this_tick = self._get_current_mtime()
 
         # Check if cache is valid (within 2 seconds tolerance)
         if self._cached_df is not None and abs(current_mtime - self._last_mtime) < 2:
+            try:
+                self._flush_pending_rows()
+                return
+            except Exception as e:
+                # The buffered rows are already in the workbook; drop the cache and reload below,
+                # which saves them first and reads them back from disk
+                print_(f"Error merging new rows into cached data: {str(e)}", "RED")
+                self._cached_df = None
+                self._search_index = None
+                self._pending_rows = []
+
+        # Cache invalid, reload from disk (re-stat: invalidating may have written pending saves)
+        if not self.invalidate_cache():
             return
-
-        # Cache invalid, reload from disk
-        self.invalidate_cache()
+        current_mtime = self._mtime_this_tick = self._get_current_mtime()
         print_(f"Reloading Excel data from file", "YELLOW")
         try:
-            # Load data with pandas
-            df = pd.read_excel(self.file_path)
+            # Reuse the parse from an earlier run if this exact file version was seen before
+            df = self._load_df_cache(current_mtime)
+            if df is None:
+                df = self._read_excel_data()
+                # Normalize search columns once per load instead of on every search;
+                # they are cached on disk with the data so a cache hit skips this too
+                self._add_search_columns(df)
+                self._save_df_cache(df, current_mtime)
+
+            # Update cache
+            self._cached_df = df
+            self._search_index = None
+            self._row_count = len(df) + 1
+            self._last_mtime = current_mtime
+
+        except Exception as e:
+            print_(f"Error loading Excel data: {str(e)}", "RED")
+            self.invalidate_cache()
+
+    def _read_excel_data(self):
+        """
+        Parse the Excel file into a DataFrame with an _internal_status column.
+
+        Returns:
+            DataFrame of sheet values plus _internal_status derived from Status cell colors
+        """
+        # Load data with pandas; only the known fields are parsed (Status is read via its cell colors)
+        df = pd.read_excel(self.file_path, engine=_READ_ENGINE, usecols=lambda column: column in ALL_FIELDS)
+
+        # Read Status cell colors for the DataFrame's rows: scan the sheet XML directly,
+        # falling back to openpyxl for anything the scanner does not handle
+        colors = self._read_status_colors_xml(self.file_path, len(df))
+        if colors is None:
+            colors = self._read_status_colors(len(df))
+        color_to_code = self.COLOR_STATUS_CODES.get
+        none_code = self.STATUS_CATEGORIES.index('NONE')
+        codes = np.fromiter((color_to_code(color, none_code) for color in colors), dtype=np.int8, count=len(colors))
+
+        # Add internal status column to DataFrame (1 byte per row instead of a str object)
+        df['_internal_status'] = pd.Categorical.from_codes(codes, categories=self.STATUS_CATEGORIES)
+        return df
+
+    def _get_df_cache_path(self, mtime):
+        """
+        Get the on-disk cache path for the current version of the Excel file.
+
+        Args:
+            mtime: Modification time of the Excel file
 
-            # Load workbook with openpyxl to read cell colors
-            wb = load_workbook(filename=self.file_path)
+        Returns:
+            Path of the pickle file for this (cache version, path, mtime, size)
+        """
+        size = os.path.getsize(self.file_path)
+        raw_key = f"{self.DF_CACHE_VERSION}|{os.path.abspath(self.file_path)}|{mtime}|{size}"
+        key = hashlib.blake2b(raw_key.encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self.DF_CACHE_DIR, f"{key}.pkl")
+
+    def _load_df_cache(self, mtime):
+        """
+        Load a previously parsed DataFrame for this exact file version.
+
+        Returns:
+            Cached DataFrame, or None on a cache miss or unreadable cache file
+        """
+        try:
+            return pd.read_pickle(self._get_df_cache_path(mtime))
+        except Exception:
+            return None
+
+    def _save_df_cache(self, df, mtime):
+        """
+        Atomically store a parsed DataFrame on disk, keeping only the newest DF_CACHE_MAX_FILES entries.
+        Failures are ignored; the cache is only an optimization.
+        """
+        try:
+            os.makedirs(self.DF_CACHE_DIR, exist_ok=True)
+            cache_path = self._get_df_cache_path(mtime)
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+
+            entries = sorted(
+                (entry for entry in os.scandir(self.DF_CACHE_DIR) if entry.name.endswith('.pkl')),
+                key=lambda entry: entry.stat().st_mtime,
+                reverse=True,
+            )
+            for entry in entries[self.DF_CACHE_MAX_FILES:]:
+                os.remove(entry.path)
+        except Exception:
+            pass
+
+    def _read_status_colors(self, row_count):
+        """
+        Read Status cell fill colors with a read-only openpyxl workbook.
+
+        Args:
+            row_count: Number of data rows to read (rows 2 .. row_count + 1)
+
+        Returns:
+            List of ARGB color strings (None for cells without a fill)
+        """
+        # Stream cells with a read-only workbook (no full cell tree in memory);
+        # the writable workbook is loaded lazily by _get_workbook() when a write needs it
+        wb = load_workbook(filename=self.file_path, read_only=True)
+        try:
             ws = wb.active
 
             # Get Status column index
-            headers = {cell.value: cell.column for cell in ws[1]}
+            header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            headers = {value: idx for idx, value in enumerate(header_row, 1)}
 
             if 'Status' not in headers:
-                # If no Status column, add empty _internal_status column
                 raise ValueError("'Status' column not found in the Excel file.")
-            else:
-                status_col_idx = headers['Status']
+            status_col_idx = headers['Status']
+
+            return [
+                cell.fill.start_color.rgb if cell.fill else None
+                for (cell,) in ws.iter_rows(min_row=2, max_row=row_count + 1,
+                                            min_col=status_col_idx, max_col=status_col_idx)
+            ]
+        finally:
+            wb.close()
 
-            # Read status colors for all data rows
-            status_list = []
-            for row_idx in range(2, ws.max_row + 1):  # Start from row 2 (skip header)
-                cell = ws.cell(row=row_idx, column=status_col_idx)
-                color_rgb = cell.fill.start_color.rgb if cell.fill else None
-                status = self._color_to_status(color_rgb)
-                status_list.append(status)
+    @staticmethod
+    def _read_status_colors_xml(file_path, row_count):
+        """
+        Read Status cell fill colors by parsing the xlsx package directly: styles.xml once for
+        style id -> fill color, then a streaming pass over the active sheet's cell style ids.
+        No openpyxl Cell or Fill objects are built.
 
-            # Add internal status column to DataFrame
-            df['_internal_status'] = status_list
+        Args:
+            file_path: Path to the xlsx file
+            row_count: Number of data rows to read (rows 2 .. row_count + 1)
 
-            # Update cache (keep workbook open for future writes)
-            self._cached_df = df
-            self._cached_workbook = wb
-            self._last_mtime = current_mtime
+        Returns:
+            List of ARGB color strings (None for cells without a fill color),
+            or None if the file uses a layout this scanner does not handle
+        """
+        try:
+            with zipfile.ZipFile(file_path) as zf:
+                # Locate the active sheet the same way openpyxl's wb.active does
+                workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+                view = workbook.find(f'{_NS_MAIN}bookViews/{_NS_MAIN}workbookView')
+                active_tab = int(view.get('activeTab', 0)) if view is not None else 0
+                sheet = workbook.findall(f'{_NS_MAIN}sheets/{_NS_MAIN}sheet')[active_tab]
+                rel_id = sheet.get(f'{_NS_DOC_REL}id')
+                rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+                target = next(rel.get('Target') for rel in rels if rel.get('Id') == rel_id)
+                sheet_path = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+
+                # Style id -> foreground color of its fill
+                styles = ET.fromstring(zf.read('xl/styles.xml'))
+                fill_colors = []
+                for fill in styles.iterfind(f'{_NS_MAIN}fills/{_NS_MAIN}fill'):
+                    fg = fill.find(f'{_NS_MAIN}patternFill/{_NS_MAIN}fgColor')
+                    rgb = fg.get('rgb') if fg is not None else None
+                    fill_colors.append('00' + rgb if rgb and len(rgb) == 6 else rgb)
+                style_colors = [
+                    fill_colors[int(xf.get('fillId', 0))]
+                    for xf in styles.iterfind(f'{_NS_MAIN}cellXfs/{_NS_MAIN}xf')
+                ]
+
+                # Stream the sheet: header row gives the Status column, data rows give style ids
+                shared_strings = None
+                status_col = None
+                row_styles = {}
+                for _, elem in ET.iterparse(zf.open(sheet_path)):
+                    if elem.tag != f'{_NS_MAIN}row':
+                        continue
+                    for cell in elem.iterfind(f'{_NS_MAIN}c'):
+                        col, row = _CELL_REF_RE.fullmatch(cell.get('r')).groups()
+                        row = int(row)
+                        if row == 1:
+                            value = cell.findtext(f'{_NS_MAIN}v')
+                            if cell.get('t') == 's':
+                                if shared_strings is None:
+                                    shared_strings = [
+                                        ''.join(si.itertext())
+                                        for si in ET.fromstring(zf.read('xl/sharedStrings.xml'))
+                                    ]
+                                value = shared_strings[int(value)]
+                            elif cell.get('t') == 'inlineStr':
+                                value = ''.join(cell.find(f'{_NS_MAIN}is').itertext())
+                            if value == 'Status':
+                                status_col = col
+                        elif col == status_col and row <= row_count + 1:
+                            row_styles[row] = int(cell.get('s', 0))
+                    elem.clear()
+        except Exception:
+            return None
 
-        except Exception as e:
-            print_(f"Error loading Excel data: {str(e)}", "RED")
-            self.invalidate_cache()
+        if status_col is None:
+            return None
+        return [style_colors[row_styles[row]] if row in row_styles else None
+                for row in range(2, row_count + 2)]
+
+    @staticmethod
+    def _add_search_columns(df):
+        """
+        Coerce the searched text columns to strings and add normalized helper columns
+        used by search_applications.
+
+        Args:
+            df: DataFrame with 'Company' and 'Job Title' columns, modified in place
+        """
+        # Done once per load rather than on every search
+        df['Company'] = company = df['Company'].fillna('').astype(str)
+        df['Job Title'] = df['Job Title'].fillna('').astype(str)
+        df['norm_company'] = normalize_company_series(company)
+        # Abbreviation is per-word logic; company names repeat, so compute it once per distinct name
+        df['abbr_company'] = company.map({name: get_abbreviation_lower(name) for name in company.unique()})
+        df['clean_job_title'] = cleaned_series(df['Job Title']).str.lower()
+
+    def _flush_pending_rows(self):
+        """
+        Merge rows buffered by append_data_to_excel into the cached DataFrame with a single concat.
+        """
+        if not self._pending_rows:
+            return
+        new_df = pd.DataFrame(self._pending_rows)
+        # Initialize status for new rows (same categories, so concat keeps the categorical dtype)
+        new_df['_internal_status'] = pd.Categorical(['NONE'] * len(new_df), categories=self.STATUS_CATEGORIES)
+        self._add_search_columns(new_df)
+        self._cached_df = pd.concat([self._cached_df, new_df], ignore_index=True)
+        self._search_index = None
+        self._pending_rows = []
+
+    def _get_search_index(self):
+        """
+        Get hash indexes from search keys to row positions, built once per cached DataFrame.
+
+        Returns:
+            Dict with 'title' (job title word -> positions),
+            'abbr_company' (abbreviation -> positions),
+            'norm_company' (normalized company -> positions) and
+            'company_names' (sorted norm_company keys, for prefix lookups)
+        """
+        if self._search_index is None:
+            df = self._cached_df
+            title_index = {}
+            for pos, title in enumerate(df['clean_job_title']):
+                for token in set(_WORD_RE.findall(title)):
+                    title_index.setdefault(token, []).append(pos)
+            company_index = df.groupby('norm_company', sort=False).indices
+            self._search_index = {
+                'title': title_index,
+                'abbr_company': df.groupby('abbr_company', sort=False).indices,
+                'norm_company': company_index,
+                'company_names': sorted(company_index),
+            }
+        return self._search_index
+
+    def _index_mask(self, key, value):
+        """
+        Look up value in one of the search indexes.
+        For 'title', this equals searching clean_job_title for r'\b<value>\b' when value is a single word.
+
+        Args:
+            key: Index name ('title' or 'abbr_company')
+            value: Value to look up
+
+        Returns:
+            Boolean Series aligned with the cached DataFrame
+        """
+        df = self._cached_df
+        mask = np.zeros(len(df), dtype=bool)
+        mask[self._get_search_index()[key].get(value, [])] = True
+        return pd.Series(mask, index=df.index)
+
+    def _company_prefix_mask(self, prefix):
+        """
+        Find rows whose norm_company starts with prefix by bisecting the sorted company names,
+        so the cost grows with the number of matching names rather than with the row count.
+
+        Args:
+            prefix: Normalized company prefix
+
+        Returns:
+            Boolean Series aligned with the cached DataFrame
+        """
+        index = self._get_search_index()
+        names = index['company_names']
+        mask = np.zeros(len(self._cached_df), dtype=bool)
+        pos = bisect.bisect_left(names, prefix)
+        while pos < len(names) and names[pos].startswith(prefix):
+            mask[index['norm_company'][names[pos]]] = True
+            pos += 1
+        return pd.Series(mask, index=self._cached_df.index)
+
+    def _create_session_backup(self):
+        """
+        Copy the Excel file to the system temp directory on the first call per ExcelManager.
+        """
+        if self._session_backup_done:
+            return
+
+        temp_dir = tempfile.gettempdir()
+        backup_filename = os.path.join(temp_dir, f"{self.BACKUP_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
+        shutil.copy2(self.file_path, backup_filename)
+        self._session_backup_done = True
+        print_(f"\nBackup created at {backup_filename}")
+
+    def _get_workbook(self):
+        """
+        Get the writable workbook, loading it from disk on first use.
+
+        Returns:
+            Cached openpyxl Workbook
+        """
+        if self._cached_workbook is None:
+            self._cached_workbook = load_workbook(filename=self.file_path)
+        return self._cached_workbook
+
+    def _get_headers(self):
+        """
+        Get the header-to-column-index map of the cached workbook, built once per load.
+
+        Returns:
+            Dict mapping header names to 1-based column indices
+        """
+        if self._headers is None:
+            self._headers = {cell.value: cell.column for cell in self._get_workbook().active[1]}
+        return self._headers
 
     def _save_data(self):
         """
         Save cached workbook to disk and update mtime.
+        Writes to a temporary file next to the (symlink-resolved) target and swaps it in with os.replace,
+        so an interrupted save never leaves a truncated workbook behind.
         Reports errors if save fails.
         """
-        if self._cached_workbook is not None:
+        # Hold the lock for the whole write so the workbook can't be edited or closed mid-save
+        with self._workbook_lock:
+            if self._cached_workbook is not None:
+                tmp_path = None
+                # Resolve symlinks so the link itself isn't replaced by a regular file
+                target = os.path.realpath(self.file_path)
+                try:
+                    fd, tmp_path = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(target))
+                    os.close(fd)
+                    self._cached_workbook.save(tmp_path)
+                    if os.path.exists(target):
+                        shutil.copymode(target, tmp_path)  # mkstemp creates files as 0600
+                    os.replace(tmp_path, target)
+                    tmp_path = None
+                    self._last_mtime = self._get_current_mtime()
+                except Exception as e:
+                    print_(f"Error saving workbook: {str(e)}", "RED")
+                    raise
+                finally:
+                    if tmp_path is not None and os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+
+    def _request_save(self):
+        """
+        Queue a workbook save for the background writer thread.
+        The writer is started on first use and flushed at interpreter exit.
+        """
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+            self._save_thread.start()
+            atexit.register(self.flush)
+        self._save_queue.put(None)
+
+    def _save_worker(self):
+        """
+        Drain save requests, coalescing any that queued up during a save into one write.
+        """
+        while True:
+            self._save_queue.get()
+            pending = 1
+            while True:
+                try:
+                    self._save_queue.get_nowait()
+                    pending += 1
+                except queue.Empty:
+                    break
             try:
-                self._cached_workbook.save(self.file_path)
-                self._last_mtime = self._get_current_mtime()
-            except Exception as e:
-                print_(f"Error saving workbook: {str(e)}", "RED")
-                raise
+                self._save_data()
+            except Exception:
+                pass  # Already reported by _save_data; keep the writer alive
+            finally:
+                for _ in range(pending):
+                    self._save_queue.task_done()
+
+    def flush(self):
+        """
+        Block until all queued saves have been written to disk.
+        The write happens on the calling thread: it may already hold the workbook lock
+        (e.g. inside @sync), so waiting for the writer thread could deadlock. A writer
+        run still queued afterwards is harmless.
+
+        Returns:
+            True if nothing was pending or the save succeeded, False if it failed
+        """
+        if self._save_thread is None or not self._save_queue.unfinished_tasks:
+            return True
+        with self._workbook_lock:
+            try:
+                self._save_data()
+            except Exception:
+                return False  # Already reported by _save_data
+        return True
 
     def invalidate_cache(self):
-        """Public method to force clear Excel data cache."""
-        if self._cached_df is not None:
-            self._cached_df = None
-            self._last_mtime = 0.0
+        """
+        Public method to force clear Excel data cache.
 
-        # Close and clear cached workbook
-        if self._cached_workbook is not None:
-            self._cached_workbook.close()
-            self._cached_workbook = None
+        Returns:
+            True if the cache was cleared, False if unsaved edits had to be kept in memory
+        """
+        with self._workbook_lock:
+            # Write out saves still queued for the writer thread before the workbook is dropped,
+            # otherwise they would find no workbook and the edits would be lost
+            if not self.flush():
+                # Nothing reached the disk: keep the workbook and merge the buffered rows into
+                # the cached DataFrame instead of discarding them
+                self._flush_pending_rows()
+                print_("Unsaved changes could not be written; keeping them in memory.", "RED")
+                return False
 
-            print_("Excel data will be reloaded from disk next time.", "YELLOW")
+            # Buffered rows are on disk now and come back with the next load
+            if self._cached_df is not None:
+                self._cached_df = None
+                self._search_index = None
+                self._last_mtime = 0.0
+            self._pending_rows = []
+            self._row_count = None
+
+            # Close and clear cached workbook
+            if self._cached_workbook is not None:
+                self._cached_workbook.close()
+                self._cached_workbook = None
+                self._headers = None
+
+                print_("Excel data will be reloaded from disk next time.", "YELLOW")
+        return True
 
     def _check_for_write_conflict(self):
         """
@@ -205,7 +646,11 @@ class ExcelManager:
             # No previous read, safe to write
             return True
 
-        current_mtime = self._get_current_mtime()
+        # Reuse the mtime _sync_data just read for this operation instead of stat'ing again;
+        # only stat when it looks stale, since a queued save may have landed since then
+        current_mtime = self._mtime_this_tick
+        if current_mtime is None or abs(current_mtime - self._last_mtime) > 2:
+            current_mtime = self._get_current_mtime()
 
         # Check if file modified externally (2 second tolerance)
         if abs(current_mtime - self._last_mtime) > 2:
@@ -234,10 +679,10 @@ class ExcelManager:
         """
 
         def create_new_excel():
-            wb = Workbook()
-            ws = wb.active
-            for col, field in enumerate(['Status'] + ALL_FIELDS, 1):
-                ws.cell(row=1, column=col, value=field)
+            # Write-only workbook streams the header row straight to disk
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(['Status'] + ALL_FIELDS)
             wb.save(self.file_path)
             print_(f"Created new Excel file at {self.file_path}", "GREEN")
 
@@ -260,11 +705,13 @@ class ExcelManager:
                     return False
 
             # Check if all required columns exist
-            wb = load_workbook(filename=self.file_path)
-            ws = wb.active
-            existing_headers = [cell.value for cell in ws[1]]
+            # Only the header row is needed, so stream it from a read-only workbook
+            wb = load_workbook(filename=self.file_path, read_only=True)
+            try:
+                existing_headers = next(wb.active.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            finally:
+                wb.close()
             missing_headers = [header for header in ['Status'] + ALL_FIELDS if header not in existing_headers]
-            wb.close()
 
             if missing_headers:
                 # Confirm to backup and create new file
@@ -337,14 +784,8 @@ class ExcelManager:
             norm_keyword = normalize_company_name(search_term)
             abbr_keyword = get_abbreviation_lower(norm_keyword)
 
-            # Ensure target columns are string type
-            df['Company'] = df['Company'].astype(str).fillna('')
-            df['Job Title'] = df['Job Title'].astype(str).fillna('')
-
-            # 2. Create helper columns using vectorized `apply`
-            df['norm_company'] = df['Company'].apply(normalize_company_name)
-            df['abbr_company'] = df['Company'].apply(get_abbreviation_lower)
-            df['clean_job_title'] = df['Job Title'].apply(cleaned_string).str.lower()
+            # 2. 'Company'/'Job Title' are coerced to str and the helper columns
+            # (norm_company, abbr_company, clean_job_title) are prepared in _sync_data
 
             # Create a regex pattern for word-level matching
             job_title_pattern = r'\b' + re.escape(search_term_clean_lower) + r'\b'
@@ -352,19 +793,21 @@ class ExcelManager:
             # 3. Build boolean masks that perfectly replicate the original function's logic
 
             # Mask 1: Direct, Prefix, and Job Title matches
+            # (a direct match is also a prefix match; single-word titles come from the token index)
             m_base = (
-                    (df['norm_company'] == norm_keyword) |
-                    (df['norm_company'].str.startswith(norm_keyword, na=False)) |
-                    (df['clean_job_title'].str.contains(job_title_pattern, na=False, regex=True))
+                    self._company_prefix_mask(norm_keyword) |
+                    (self._index_mask('title', search_term_clean_lower)
+                     if _WORD_RE.fullmatch(search_term_clean_lower)
+                     else df['clean_job_title'].str.contains(job_title_pattern, na=False, regex=True))
             )
 
             # Mask 2: Handles "om" matching "Old Mission"
-            m_abbr_target = (df['abbr_company'] == norm_keyword)
+            m_abbr_target = self._index_mask('abbr_company', norm_keyword)
 
             # Mask 3: Handles "GSK" matching "GlaxoSmithKline"
-            m_abbr_keyword_vs_abbr_target = pd.Series([False] * len(df), index=df.index)
+            m_abbr_keyword_vs_abbr_target = pd.Series(False, index=df.index)
             if len(abbr_keyword) > 1:
-                m_abbr_keyword_vs_abbr_target = (df['abbr_company'] == abbr_keyword)
+                m_abbr_keyword_vs_abbr_target = self._index_mask('abbr_company', abbr_keyword)
 
             # 4. Combine all masks using logical OR
             final_mask = m_base | m_abbr_target | m_abbr_keyword_vs_abbr_target
@@ -375,19 +818,16 @@ class ExcelManager:
             if matched_df.empty:
                 return []
 
-            matches = []
-            for idx, row in matched_df.iterrows():
-                excel_row_index = idx + 2  # Convert 0-based DataFrame index to 1-based Excel row index
-                matches.append({
-                    'Company': row['Company'],
-                    'Location': row['Location'],
-                    'Job Title': row['Job Title'],
-                    'Applied Date': applied_date(row.to_dict()),
-                    'Processed Date': row.get('Processed Date', ''),
-                    'Result Date': row.get('Result Date', ''),
-                    'status': self._status_to_symbol(row.get('_internal_status', 'NONE')),
-                    'row_index': excel_row_index,
-                })
+            # Project the result columns and derive display fields column-wise, then emit records
+            result_columns = ['Company', 'Location', 'Job Title', 'Applied Date',
+                              'Processed Date', 'Result Date', '_internal_status']
+            result_df = matched_df.reindex(columns=result_columns, fill_value='')
+
+            applied = result_df['Applied Date']
+            result_df['Applied Date'] = applied.astype(object).where(applied.notna(), '')
+            result_df['status'] = result_df.pop('_internal_status').map(self.STATUS_SYMBOLS).astype(object)
+            result_df['row_index'] = result_df.index + 2  # Convert 0-based DataFrame index to 1-based Excel row index
+            matches = result_df.to_dict('records')
 
             return matches
 
@@ -404,28 +844,20 @@ class ExcelManager:
         if new_data is None:
             return None
         try:
-            # Create a deep copy to avoid polluting cache
-            df = self._cached_df.copy()
+            df = self._cached_df
 
             if df.empty:
                 return None
 
-            # Convert all columns to string for comparison
-            for col in df.columns:
-                if col != '_internal_status':  # Skip internal column
-                    df[col] = df[col].astype(str).apply(lambda x: x.strip() if x != 'nan' else '')
-
-            # Check each row for exact match
-            for _, row in df.iterrows():
-                all_fields_match = True
-                for field in ['Company', 'Job Title']:
-                    if field in row and field in new_data:
-                        if str(row[field]).strip() != str(new_data[field]).strip():
-                            all_fields_match = False
-                            break
-                if all_fields_match:
-                    return row
-            return None
+            # Build one boolean mask for exact match, casting only the compared columns
+            mask = pd.Series(True, index=df.index)
+            for field in ['Company', 'Job Title']:
+                if field in df.columns and field in new_data:
+                    mask &= df[field].fillna('').astype(str).str.strip() == str(new_data[field]).strip()
+
+            if not mask.any():
+                return None
+            return df.loc[mask].iloc[0].reindex(ALL_FIELDS).fillna('')
 
         except Exception as e:
             print_(f"Error checking for duplicates: {str(e)}", "RED")
@@ -449,9 +881,10 @@ class ExcelManager:
             total_applications = len(df)
 
             # Count status from _internal_status column
-            rejections = len(df[df['_internal_status'] == 'REJECTED'])
-            processing = len(df[df['_internal_status'] == 'PROCESSING'])
-            offers = len(df[df['_internal_status'] == 'OFFER'])
+            # (bincount over the categorical codes, ordered as STATUS_CATEGORIES)
+            codes = df['_internal_status'].cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(self.STATUS_CATEGORIES))
+            rejections, processing, offers = (int(n) for n in counts[:3])
 
             # Calculate percentages
             rejection_rate = (rejections / total_applications * 100) if total_applications > 0 else 0
@@ -511,14 +944,19 @@ class ExcelManager:
             if not self._check_for_write_conflict():
                 return
 
-            sheet = self._cached_workbook.active
-            last_row = sheet.max_row
+            sheet = self._get_workbook().active
+            last_row = self._row_count if self._row_count is not None else sheet.max_row
+            if last_row < 2:  # Only the header row is left
+                print_("No data rows to delete.", "RED")
+                return
             sheet.delete_rows(last_row)
+            self._row_count = last_row - 1
 
             # Update cached DataFrame: drop last row
             if self._cached_df is not None and len(self._cached_df) > 0:
                 self._cached_df.drop(self._cached_df.index[-1], inplace=True)
                 self._cached_df.reset_index(drop=True, inplace=True)  # Reset index to avoid gaps
+                self._search_index = None
 
             print_(f"Last row deleted successfully.", "GREEN")
 
@@ -532,15 +970,11 @@ class ExcelManager:
         Returns True if successful, False otherwise.
         """
         try:
-            import subprocess
-            import platform
-            system = platform.system()
-            if system == 'Darwin':  # macOS
-                subprocess.run(['open', self.file_path])
-            elif system == 'Windows':
-                subprocess.run(['start', '', self.file_path], shell=True)
-            else:  # Linux and other OS
-                subprocess.run(['xdg-open', self.file_path])
+            if _FILE_OPENER is None:  # Windows
+                os.startfile(self.file_path)
+            else:  # macOS / Linux and other OS; don't block the CLI on the spawned viewer
+                subprocess.Popen([_FILE_OPENER, self.file_path], close_fds=True, start_new_session=True,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print_(f"Excel file opened successfully.", "GREEN")
         except Exception as e:
             print_(f"Error opening Excel file: {str(e)}", "RED")
@@ -563,20 +997,13 @@ class ExcelManager:
             if not self._check_for_write_conflict():
                 return
 
-            # Use cached workbook or load new one
-            if self._cached_workbook is None:
-                workbook = load_workbook(filename=self.file_path)
-                self._cached_workbook = workbook
-            else:
-                workbook = self._cached_workbook
-
-            sheet = workbook.active
+            sheet = self._get_workbook().active
 
             # Find the last row with data (or the header row if the sheet is empty)
-            last_row = sheet.max_row if sheet.max_row > 1 else 1
+            last_row = self._row_count if self._row_count is not None else max(sheet.max_row, 1)
 
-            # Get the headers and their column indices
-            headers = {cell.value: cell.column for cell in sheet[1]}
+            # Get the headers and their column indices (missing columns added below update the cache too)
+            headers = self._get_headers()
 
             # List of all possible columns
             all_columns = ALL_FIELDS
@@ -589,19 +1016,25 @@ class ExcelManager:
                     sheet.cell(row=1, column=next_column, value=column)
                     next_column += 1
 
-            # Append the new data directly to the last row
+            # Resolve target column indices once (Status is handled separately)
+            column_targets = [(column, headers[column]) for column in all_columns if column != 'Status']
+            status_col = headers['Status']
+            no_fill = PatternFill(fill_type=None)
+
+            # Append the new data directly to the last row. sheet.cell() with an explicit row is used
+            # rather than sheet.append(), whose internal row counter is not moved back by delete_rows()
+            write_cell = sheet.cell
             for row_data in data:
                 last_row += 1  # Move to the next row for each new record
+                get_value = row_data.get
+                for column, column_idx in column_targets:
+                    write_cell(row=last_row, column=column_idx, value=get_value(column, ''))
+                # The row may be a formatted-but-empty one pandas skipped; don't inherit its status color
+                write_cell(row=last_row, column=status_col).fill = no_fill
+            self._row_count = last_row
 
-                # Write data to the corresponding columns
-                for column in all_columns:
-                    if column != 'Status':  # Skip Status column as it's handled separately
-                        sheet.cell(row=last_row, column=headers[column],
-                                   value=row_data.get(column, ''))
-
-            new_df = pd.DataFrame(data)
-            new_df['_internal_status'] = 'NONE'  # Initialize status for new rows
-            self._cached_df = pd.concat([self._cached_df, new_df], ignore_index=True)
+            # Buffer the rows for the cached DataFrame; they are merged on the next sync
+            self._pending_rows.extend(dict(row_data) for row_data in data)
 
         except Exception as e:
             print_(f"Error appending data to Excel: {str(e)}")
@@ -631,23 +1064,13 @@ class ExcelManager:
             if not self._check_for_write_conflict():
                 return False
 
-            # Create backup using system temp directory
-            temp_dir = tempfile.gettempdir()
-            backup_filename = os.path.join(temp_dir, f"job_application_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
-            shutil.copy2(self.file_path, backup_filename)
-            print_(f"\nBackup created at {backup_filename}")
-
-            # Use cached workbook or load new one
-            if self._cached_workbook is None:
-                workbook = load_workbook(filename=self.file_path)
-                self._cached_workbook = workbook
-            else:
-                workbook = self._cached_workbook
+            # Back up the file once per session before the first status change
+            self._create_session_backup()
 
-            sheet = workbook.active
+            sheet = self._get_workbook().active
 
             # Find the Status and date columns
-            headers = {cell.value: cell.column for cell in sheet[1]}
+            headers = self._get_headers()
 
             if 'Status' not in headers:
                 raise ValueError("[DEBUG] 'Status' column not found in the Excel file.")
@@ -671,8 +1094,10 @@ class ExcelManager:
                 internal_status = self._color_to_status(status_color)
                 self._cached_df.at[df_index, '_internal_status'] = internal_status
 
-                # Update date column in DataFrame as well
+                # Update date column in DataFrame as well (an all-empty column is read as float64)
                 if date_column in self._cached_df.columns:
+                    if self._cached_df[date_column].dtype != object:
+                        self._cached_df[date_column] = self._cached_df[date_column].astype(object)
                     self._cached_df.at[df_index, date_column] = current_date
 
             print_(f"Row {row_index - 1} marked as {status_name}.", "GREEN")
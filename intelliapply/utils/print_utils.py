@@ -63,17 +63,24 @@ def print_results(results, mark_mode=False):
 
     print_(f"Found {len(results)} matching records:", "GREEN")
 
+    # Format every cell once; the strings are reused for the widths and the rows
+    rows = [(str(r.get('Applied Date', '')),
+             str(r.get('status', '')),
+             format_string(r['Company'], limit=30),
+             format_string(r['Location']),
+             format_string(r['Job Title'], limit=65)) for r in results]
+
     # Calculate maximum widths for each column, including 'Status'
-    company_width = max(len(format_string(r['Company'], limit=30)) for r in results)
+    company_width = max(len(row[2]) for row in rows)
     company_width = max(company_width, len("Company"))
 
-    location_width = max(len(format_string(r['Location'])) for r in results)
+    location_width = max(len(row[3]) for row in rows)
     location_width = max(location_width, len("Location"))
 
-    job_width = max(len(format_string(r['Job Title'], limit=65)) for r in results)
+    job_width = max(len(row[4]) for row in rows)
     job_width = max(job_width, len("Job Title"))
 
-    status_width = max(len(str(r.get('status', ''))) for r in results)
+    status_width = max(len(row[1]) for row in rows)
     status_width = max(status_width, len("Status"))
 
     # Width for the index column in mark mode
@@ -83,9 +90,9 @@ def print_results(results, mark_mode=False):
     header, separator = "", ""
 
     # Check if any Applied Date is valid
-    has_valid_date = any(str(r.get('Applied Date', '')).strip() != '' for r in results)
+    has_valid_date = any(row[0].strip() != '' for row in rows)
     if has_valid_date:
-        date_width = max(len(str(r.get('Applied Date', ''))) for r in results)
+        date_width = max(len(row[0]) for row in rows)
         date_width = max(date_width, len("Applied Date"))
 
         if mark_mode:
@@ -136,16 +143,16 @@ def print_results(results, mark_mode=False):
     max_line_length = max(len(header), len(separator))
 
     # Generate data rows
-    for i, result in enumerate(results, 1):
+    for i, (applied_date, status, company, location, job_title) in enumerate(rows, 1):
         if has_valid_date:
             if mark_mode:
                 line = "{:<{width0}}  {:<{width5}}  {:<{width1}}  {:<{width2}}  {:<{width3}}  {:<{width4}}".format(
                     str(i),
-                    str(result.get('Applied Date', '')),
-                    str(result['status']),
-                    format_string(result['Company'], limit=30),
-                    format_string(result['Location']),
-                    format_string(result['Job Title'], limit=65),
+                    applied_date,
+                    status,
+                    company,
+                    location,
+                    job_title,
                     width0=index_width,
                     width5=date_width,
                     width1=status_width,
@@ -155,11 +162,11 @@ def print_results(results, mark_mode=False):
                 )
             else:
                 line = "{:<{width5}}  {:<{width1}}  {:<{width2}}  {:<{width3}}  {:<{width4}}".format(
-                    str(result.get('Applied Date', '')),
-                    str(result['status']),
-                    format_string(result['Company'], limit=30),
-                    format_string(result['Location']),
-                    format_string(result['Job Title'], limit=65),
+                    applied_date,
+                    status,
+                    company,
+                    location,
+                    job_title,
                     width5=date_width,
                     width1=status_width,
                     width2=company_width,
@@ -170,10 +177,10 @@ def print_results(results, mark_mode=False):
             if mark_mode:
                 line = "{:<{width0}}  {:<{width1}}  {:<{width2}}  {:<{width3}}  {:<{width4}}".format(
                     str(i),
-                    str(result['status']),
-                    format_string(result['Company'], limit=30),
-                    format_string(result['Location']),
-                    format_string(result['Job Title'], limit=65),
+                    status,
+                    company,
+                    location,
+                    job_title,
                     width0=index_width,
                     width1=status_width,
                     width2=company_width,
@@ -182,10 +189,10 @@ def print_results(results, mark_mode=False):
                 )
             else:
                 line = "{:<{width1}}  {:<{width2}}  {:<{width3}}  {:<{width4}}".format(
-                    str(result['status']),
-                    format_string(result['Company'], limit=30),
-                    format_string(result['Location']),
-                    format_string(result['Job Title'], limit=65),
+                    status,
+                    company,
+                    location,
+                    job_title,
                     width1=status_width,
                     width2=company_width,
                     width3=location_width,
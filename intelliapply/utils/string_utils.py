@@ -1,5 +1,14 @@
 import re
 import json
+import functools
+
+# Patterns used on every call are compiled once at import
+_CONTROL_WS_RE = re.compile(r'[\n\t\r]')
+_PUNCTUATION_RE = re.compile(r'[!@#$%^&*()_+=\[\]{}|;\':"<>?,./-]')
+_MULTI_WS_RE = re.compile(r'\s+')
+# One alternation replaces a re.sub per company term
+_COMPANY_TERMS_RE = re.compile(r'\b(?:corporation|corp|inc|incorporated|limited|ltd|llc|cooperation|logo)\b')
+_JSON_START_RE = re.compile(r'^\s*[\[{]')
 
 
 def cleaned_string(text):
@@ -8,13 +17,13 @@ def cleaned_string(text):
         return ''
 
     # Step 1: Remove newlines, tabs, carriage returns
-    text = re.sub(r'[\n\t\r]', ' ', text)
+    text = _CONTROL_WS_RE.sub(' ', text)
 
     # Step 2: Remove common punctuation and symbols
-    text = re.sub(r'[!@#$%^&*()_+=\[\]{}|;\':"<>?,./-]', '', text)
+    text = _PUNCTUATION_RE.sub('', text)
 
     # Step 3: Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _MULTI_WS_RE.sub(' ', text)
 
     # Step 4: Strip leading/trailing whitespace
     text = text.strip()
@@ -22,35 +31,45 @@ def cleaned_string(text):
     return text
 
 
+@functools.lru_cache(maxsize=4096)
 def get_abbreviation_lower(name):
     """Get the abbreviation of a string by taking first letters of each word"""
     if not isinstance(name, str):
         return ''
-    # Remove special characters, keep only letters and spaces
-    cleaned_name = cleaned_string(name)
-    words = cleaned_name.strip().split()
-    abbr_parts = []
-    for w in words:
-        if w.isupper():
-            abbr_parts.append(w)  # Preserve the entire uppercase word
-        else:
-            abbr_parts.append(w[0].upper() if w else '')
-    return ''.join(abbr_parts).lower()
+    # Remove special characters, keep only letters and spaces; an all-uppercase word is kept whole
+    return ''.join(w if w.isupper() else w[0].upper() for w in cleaned_string(name).split()).lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_company_name(name):
     """Normalize company name by removing common suffixes and extra spaces"""
     if not isinstance(name, str):
         return ''
     # Remove common company terms
-    common_terms = ['corporation', 'corp', 'inc', 'incorporated', 'limited', 'ltd', 'llc', 'cooperation', 'logo']
-    name_lower = str(name).lower().strip()
-    for term in common_terms:
-        name_lower = re.sub(rf'\b{term}\b', '', name_lower)
+    name_lower = _COMPANY_TERMS_RE.sub('', str(name).lower().strip())
     # Remove special characters and extra spaces
     return cleaned_string(name_lower)
 
 
+# Vectorized counterparts of cleaned_string / normalize_company_name for whole columns.
+# Series are cast to object dtype so the patterns always run through Python's re module.
+
+
+def cleaned_series(series):
+    """Apply cleaned_string to every value of a Series of strings in one vectorized pass"""
+    return (series.astype(object)
+            .str.replace(_CONTROL_WS_RE, ' ', regex=True)
+            .str.replace(_PUNCTUATION_RE, '', regex=True)
+            .str.replace(_MULTI_WS_RE, ' ', regex=True)
+            .str.strip())
+
+
+def normalize_company_series(series):
+    """Apply normalize_company_name to every value of a Series of strings in one vectorized pass"""
+    lowered = series.astype(object).str.lower().str.strip()
+    return cleaned_series(lowered.str.replace(_COMPANY_TERMS_RE, '', regex=True))
+
+
 def format_string(name, limit=55):
     """Convert multi-line location to single line with semicolons"""
     formatted = '; '.join(str(name).strip().split('\n'))
@@ -78,7 +97,7 @@ def parse_json_safe(text):
         text = text.strip()
 
         # Basic JSON structure check - must start with { or [
-        if not re.match(r'^\s*[\[{]', text):
+        if not _JSON_START_RE.match(text):
             return False, None, "Not a JSON structure"
 
         # Map of non-standard characters to standard JSON characters
@@ -154,3 +173,55 @@ def parse_markdown_table(markdown_table_string):
         if len(values) == len(headers):
             data.append(dict(zip(headers, values)))
     return data
+
+
+# Elements dropped with their content by strip_html_tags; script/style hold raw text, so
+# their content is skipped straight to the closing tag instead of being scanned for nesting
+_STRIP_TAGS = ('script', 'style', 'svg', 'noscript', 'header', 'footer', 'nav', 'aside')
+_RAW_TEXT_TAGS = ('script', 'style')
+# Comments, opening/closing tags of the stripped elements, and void <link> tags
+_STRIP_TOKEN_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)|<(/?)(" + "|".join(_STRIP_TAGS + ('link',)) + r")(?![\w-])[^>]*>",
+    re.I | re.S)
+# Per element: its own opening/closing tags, used to track nesting depth (e.g. <svg> in <svg>)
+_TAG_RES = {tag: re.compile(r"<(/?)" + tag + r"(?![\w-])[^>]*>", re.I) for tag in _STRIP_TAGS}
+_RAW_CLOSE_RES = {tag: re.compile(r"</" + tag + r"\s*>", re.I) for tag in _RAW_TEXT_TAGS}
+
+
+def strip_html_tags(html):
+    """
+    Remove comments, <link> tags and the _STRIP_TAGS elements (with their content) from HTML.
+    Nested elements of the same name are matched to their own closing tag, an unclosed
+    element is removed up to the end of the input, and stray closing tags are dropped.
+    """
+    parts = []
+    pos = 0
+    end = len(html)
+    while pos < end:
+        match = _STRIP_TOKEN_RE.search(html, pos)
+        if match is None:
+            break
+        parts.append(html[pos:match.start()])
+        pos = match.end()
+        closing, tag = match.group(1), (match.group(2) or '').lower()
+        # Comments, <link>, stray closing tags and self-closing tags go on their own
+        if tag in ('', 'link') or closing or match.group(0).endswith('/>'):
+            continue
+        if tag in _RAW_CLOSE_RES:
+            close = _RAW_CLOSE_RES[tag].search(html, pos)
+            pos = close.end() if close else end
+            continue
+        depth = 1
+        tag_re = _TAG_RES[tag]
+        while depth:
+            inner = tag_re.search(html, pos)
+            if inner is None:
+                pos = end
+                break
+            pos = inner.end()
+            if inner.group(1):
+                depth -= 1
+            elif not inner.group(0).endswith('/>'):
+                depth += 1
+    parts.append(html[pos:])
+    return ''.join(parts)
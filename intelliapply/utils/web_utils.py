@@ -1,20 +1,27 @@
 import re
+import html as html_lib
 import subprocess, shutil, sys
 import pickle
+import hashlib
+import atexit
+import queue
 import threading
 import time
 import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from openai import OpenAI
 import requests
-from bs4 import BeautifulSoup, Comment
-from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.util.retry import Retry
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 from intelliapply.config.config import DOMAIN_KEYWORDS, COOKIE_PATH, HEADERS
-from intelliapply.config.prompt import SYSTEM_PROMPT, JobInfo, REQUIRED_FIELDS
-from intelliapply.config.credential import API_SERVICES, BACKUP_FOLDER_PATH
+from intelliapply.config.prompt import SYSTEM_PROMPT, JobInfo, REQUIRED_FIELDS, parse_job_info
+from intelliapply.config import credential
 from intelliapply.utils.print_utils import print_
-from intelliapply.utils.string_utils import parse_json_safe
+from intelliapply.utils.string_utils import parse_json_safe, strip_html_tags
 
 # Initialize session objects
 session = requests.session()
@@ -25,7 +32,7 @@ def save_cookie(cookie_path=COOKIE_PATH):
     """Save current session cookies to a pickle file."""
     try:
         with open(cookie_path, 'wb') as f:
-            pickle.dump(session.cookies, f)
+            pickle.dump(session.cookies, f, protocol=pickle.HIGHEST_PROTOCOL)
         print_(f"Cookie successfully saved to {cookie_path}", "GREEN")
         return True
     except Exception as e:
@@ -52,6 +59,18 @@ session.max_redirects = 5
 session_default.max_redirects = 5
 session.headers.update(HEADERS)
 session_default.headers.update(HEADERS)
+
+# Larger keep-alive pools so concurrent URL/iframe fetches reuse connections to the same host,
+# plus a short retry with backoff for transient gateway errors on GETs (connect/read failures
+# are not retried, so an unreachable host still fails within one timeout)
+for _session in (session, session_default):
+    _adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                           max_retries=Retry(total=2, connect=0, read=0, backoff_factor=0.3,
+                                             status_forcelist=(502, 503, 504),
+                                             allowed_methods=frozenset(['GET']), raise_on_status=False))
+    _session.mount('https://', _adapter)
+    _session.mount('http://', _adapter)
+    _session.headers.setdefault('Connection', 'keep-alive')
 load_cookies_to_session()
 
 # -------- Intelligent Detection Patterns --------
@@ -65,6 +84,12 @@ JS_REQUIRED_PATTERNS = [
     r'<noscript',  # generic <noscript> block
     r'cloudflare', r'cf-ray',  # CF challenge hints
 ]
+# All detectors fused into one alternation so a page is scanned once; re.I lets the
+# JS hints match without lowercasing the page first
+_DETECT_RE = re.compile("|".join(f"(?:{p})" for p in HYDRATION_PATTERNS + JS_REQUIRED_PATTERNS), re.I)
+# Only iframe src attributes are needed from a page, so they are pulled out with a regex
+# instead of building a full BeautifulSoup tree (quoted or unquoted, not data-src etc.)
+_IFRAME_SRC_RE = re.compile(r"""<iframe\b[^>]*?(?<![\w-])src\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
 BLOCK_STATUS = {403, 429, 503}
 _CHROME_CHANNELS = ['chrome', 'chrome-dev', 'chrome-canary', '']
 
@@ -123,13 +148,43 @@ def ensure_playwright_browsers():
 _PLAYWRIGHT_CHANNEL = detect_playwright_channel()
 
 
-def analyze_content_for_playwright(html, status_code, redirect=True) -> bool:
+def find_iframe_sources(html):
+    """
+    Find the src URL of every iframe in an HTML document, in document order.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        list: iframe src values with HTML entities decoded
+    """
+    return [html_lib.unescape(next(filter(None, match.groups()), ''))
+            for match in _IFRAME_SRC_RE.finditer(html)]
+
+
+def get_embedded_iframe_sources(html):
+    """
+    Find the iframe sources worth following: non-empty and not tag-manager frames.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        list: iframe src URLs in document order
+    """
+    return [src for src in find_iframe_sources(html) if src and "googletagmanager" not in src]
+
+
+def analyze_content_for_playwright(html, status_code, redirect=True, iframe_cache=None, detected=None) -> bool:
     """
     Analyze already fetched content to determine if Playwright is needed.
     
     Args:
         html: HTML content already fetched
         status_code: HTTP status code from the request
+        iframe_cache: Optional dict filled with {iframe src: content} for the iframes fetched here,
+            so process_requests_content can reuse them instead of fetching again
+        detected: Result of _DETECT_RE on html if the caller already scanned it (None: scan here)
     
     Returns:
         True if Playwright is likely needed, False otherwise
@@ -142,32 +197,26 @@ def analyze_content_for_playwright(html, status_code, redirect=True) -> bool:
     if status_code in BLOCK_STATUS:
         return True
 
-    # Check iframe content in the response and send it instead
-    soup = BeautifulSoup(html, 'html.parser')
-    iframes = soup.find_all('iframe')
-
-    # If redirect is True, check for iframe content
+    # If redirect is True, check for iframe content (fetched concurrently, first positive wins)
     if redirect:
-        for iframe in iframes:
-            iframe_src = iframe.get('src')
-            if iframe_src and "googletagmanager" not in iframe_src:
-                iframe_content, _ = get_raw_requests(iframe_src)
-                if analyze_content_for_playwright(iframe_content, status_code, redirect=False):
-                    return True
-
-    html_lc = html.lower()
-
-    # Check for hydration markers (client-side rendering)
-    for pattern in HYDRATION_PATTERNS:
-        if re.search(pattern, html, re.I):
-            return True
-
-    # Check for JS-required / Cloudflare hints
-    for pattern in JS_REQUIRED_PATTERNS:
-        if re.search(pattern, html_lc):
-            return True
-
-    return False
+        iframe_srcs = get_embedded_iframe_sources(html)
+        if iframe_srcs:
+            executor = ThreadPoolExecutor(max_workers=min(8, len(iframe_srcs)))
+            try:
+                futures = {executor.submit(get_raw_requests, src): src for src in dict.fromkeys(iframe_srcs)}
+                for future in as_completed(futures):
+                    iframe_content, _ = future.result()
+                    if iframe_cache is not None:
+                        iframe_cache[futures[future]] = iframe_content
+                    if analyze_content_for_playwright(iframe_content, status_code, redirect=False):
+                        return True
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    # Check for hydration markers (client-side rendering) and JS-required / Cloudflare hints
+    if detected is None:
+        detected = _DETECT_RE.search(html) is not None
+    return detected
 
 
 def start_browser(app_path="/Applications/Microsoft Edge Beta.app/Contents/MacOS/Microsoft Edge Beta",
@@ -220,7 +269,7 @@ def add_cookie(cookie_path=COOKIE_PATH):
         # Parse Netscape format cookies
         cookies = {}
         for line in netscape_cookie:
-            if not re.match(r'^\#', line):
+            if not line.startswith('#'):
                 lineFields = line.strip().split('\t')
                 cookies[lineFields[5]] = lineFields[6]
 
@@ -236,6 +285,20 @@ def add_cookie(cookie_path=COOKIE_PATH):
         return False
 
 
+# One case-insensitive pass per page finds every login keyword of a domain. The lookahead
+# reports a match at each position, longest keyword first, so overlapping keywords are not lost.
+_DOMAIN_KEYWORD_PATTERNS = {
+    url: re.compile("(?=(" + "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)) + "))", re.I)
+    for url, keywords in DOMAIN_KEYWORDS.items()
+}
+
+
+def contains_domain_keywords(url, text):
+    """Check whether text contains all login keywords configured for a domain URL."""
+    found = {match.lower() for match in _DOMAIN_KEYWORD_PATTERNS[url].findall(text)}
+    return all(any(keyword.lower() in match for match in found) for keyword in DOMAIN_KEYWORDS[url])
+
+
 def validate_cookie():
     """
     Validate the cookies in the pickle file with the provided domain.
@@ -244,39 +307,93 @@ def validate_cookie():
     - bool: True if the cookies are valid, False otherwise.
     """
 
-    success = True
-    for url, keywords in DOMAIN_KEYWORDS.items():
+    def check_login(url):
         try:
             response = session.get(url, timeout=5)
-            if response.status_code == 200 and all(keyword in response.text.lower() for keyword in keywords):
-                print_(f"{url} LOGGED IN.", "GREEN")
-            else:
-                print_(f"{url} NOT LOGGED IN.", "YELLOW")
-                success = False
-
+            if response.status_code == 200 and contains_domain_keywords(url, response.text):
+                return True, f"{url} LOGGED IN.", "GREEN"
+            return False, f"{url} NOT LOGGED IN.", "YELLOW"
         except requests.RequestException as e:
-            print_(f"{url} ERROR: {e}", "RED")
-            success = False
+            return False, f"{url} ERROR: {e}", "RED"
+
+    # Check all domains concurrently; report in the configured order
+    if not DOMAIN_KEYWORDS:
+        return True
+    with ThreadPoolExecutor(max_workers=len(DOMAIN_KEYWORDS)) as executor:
+        results = list(executor.map(check_login, DOMAIN_KEYWORDS))
+
+    success = True
+    for logged_in, message, color in results:
+        print_(message, color)
+        success = success and logged_in
 
     return success
 
 
-def process_webpage_content(content):
+# Per-service request pacing for services with max_requests_per_minute set
+_rate_limit_lock = threading.Lock()
+_next_request_time = {}
+
+
+def wait_for_rate_limit(service_idx, service):
+    """
+    Sleep until the service may take another request under its max_requests_per_minute.
+    Slots are reserved under a lock, so concurrent URL workers are spaced out too.
+
+    Args:
+        service_idx: 1-based index of the service in API_SERVICES
+        service: Service configuration dictionary
+    """
+    rpm = service.get('max_requests_per_minute')
+    if not rpm:
+        return
+
+    with _rate_limit_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_time.get(service_idx, now))
+        _next_request_time[service_idx] = slot + 60.0 / rpm
+
+    if slot > now:
+        time.sleep(slot - now)
+
+
+# One OpenAI client (and its connection pool) per API endpoint and key, shared across calls
+_openai_clients = {}
+_openai_clients_lock = threading.Lock()
+
+
+def get_openai_client(api_key, base_url):
+    """Get the shared OpenAI client for an API key and base URL, creating it on first use."""
+    with _openai_clients_lock:
+        client = _openai_clients.get((api_key, base_url))
+        if client is None:
+            client = _openai_clients[(api_key, base_url)] = OpenAI(api_key=api_key, base_url=base_url)
+        return client
+
+
+def process_webpage_content(content, start=0):
     """
     Process webpage content through OpenAI API and return structured data.
     Supports multiple API keys with automatic retry logic.
+
+    Args:
+        content: Webpage content to extract job information from
+        start: Index of the API service to try first; the others remain fallbacks
     """
 
-    # Try each API service in order
-    for idx, service in enumerate(API_SERVICES, 1):
+    # Try each API service in order, beginning with the requested one
+    start = start % len(credential.API_SERVICES) if credential.API_SERVICES else 0
+    services = list(enumerate(credential.API_SERVICES, 1))
+    for idx, service in services[start:] + services[:start]:
         api_key = service.get('api_key', '')
         base_url = service.get('base_url', '')
         model = service.get('model', '')
         reasoning_effort = service.get('reasoning_effort', '').strip()
 
         try:
+            wait_for_rate_limit(idx, service)
             print_(f"Service {idx}: Sending content to {model} with API key {api_key[:10]}...")
-            client = OpenAI(api_key=api_key, base_url=base_url)
+            client = get_openai_client(api_key, base_url)
 
             # Build request parameters
             request_params = {
@@ -293,19 +410,18 @@ def process_webpage_content(content):
             if reasoning_effort:
                 request_params["reasoning_effort"] = reasoning_effort
 
-            response = client.beta.chat.completions.parse(**request_params)
+            # Stream the response so a page that is not a job posting can be
+            # dropped as soon as "isValid": false arrives, without waiting for the rest
+            with client.beta.chat.completions.stream(**request_params) as stream:
+                for event in stream:
+                    if event.type == "content.delta" and isinstance(event.parsed, dict) \
+                            and event.parsed.get("isValid") is False:
+                        return {"isValid": False}
+                completion = stream.get_final_completion()
 
             # Parse the response and convert Job_Title to Job Title
-            result = response.choices[0].message.parsed
-            return {
-                "isValid": result.isValid,
-                "Company": result.Company,
-                "Location": result.Location,
-                "Job Title": result.Job_Title,
-                "Code": result.Code,
-                "Type": result.Type,
-                "Link": result.Link
-            }
+            result = completion.choices[0].message.parsed
+            return result.to_dict()
         except Exception as e:
             print_(f"Service {idx} error: {str(e)}", "RED")
             continue
@@ -329,25 +445,11 @@ def remove_script_content(html_content: str) -> str:
     3. HTML comments
     """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 1. Remove "noise" tags (high token, zero info)
-        tags_to_decompose = ['script', 'style', 'svg', 'link', 'noscript']
-        for tag in soup.find_all(tags_to_decompose):
-            tag.decompose()
-
-        # 2. Remove "Layout" tags (high token, low relevance for job info)
-        layout_tags_to_decompose = ['header', 'footer', 'nav', 'aside']
-        for tag in soup.find_all(layout_tags_to_decompose):
-            tag.decompose()
-        
-        # 3. Remove all HTML comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-            comment.extract()
-        
-        # 4. Remove excessive whitespace to compress tokens
-        cleaned_html = str(soup)
-        cleaned_html = re.sub(r'\n\s*\n', '\n', cleaned_html, flags=re.MULTILINE)
+        # 1-3. Remove noise tags, layout tags and comments in a single left-to-right scan
+        # (no DOM round-trip through a parser and back to a string)
+        cleaned_html = strip_html_tags(html_content)
+
+        # 4. Remove excessive whitespace to compress tokens (blank lines are dropped here too)
         lines = (line.strip() for line in cleaned_html.splitlines())
         compact_html = "\n".join(line for line in lines if line)
         
@@ -357,45 +459,70 @@ def remove_script_content(html_content: str) -> str:
         return html_content
 
 
+# Upper bound on the body read per fetch; every later regex pass is linear in page size
+MAX_FETCH_BYTES = 4 * 1024 * 1024
+
+
+def _decode_body(body, response):
+    """
+    Decode a response body read from the raw stream the way response.text would:
+    header charset first, then requests' charset detection, then UTF-8 for unknown labels.
+    """
+    encoding = response.encoding
+    if not encoding and chardet is not None:
+        # Same detector as response.apparent_encoding, run on the bytes already read
+        # (apparent_encoding itself would pull the rest of the stream past the size cap)
+        encoding = chardet.detect(body)['encoding']
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
 def get_raw_requests(url):
     """
     Get raw content from a URL using requests.
+    The body is streamed and cut off after MAX_FETCH_BYTES.
     Returns tuple: (content, status_code)
     """
     try:
-        if 'linkedin.com' in url or 'handshake' in url:
-            response = session.get(url, timeout=8)
-        else:
-            response = session_default.get(url, timeout=8)
-        response.raise_for_status()
-        return response.text, response.status_code
+        http = session if 'linkedin.com' in url or 'handshake' in url else session_default
+        with http.get(url, timeout=8, stream=True) as response:
+            response.raise_for_status()
+            body = response.raw.read(MAX_FETCH_BYTES + 1, decode_content=True)
+            if len(body) > MAX_FETCH_BYTES:
+                print_(f"Response larger than {MAX_FETCH_BYTES // (1024 * 1024)} MiB, truncated.", "YELLOW")
+                body = body[:MAX_FETCH_BYTES]
+            return _decode_body(body, response), response.status_code
     except Exception as e:
         print_(f"Error fetching webpage: {str(e)}", "RED")
         return "", 0
 
 
-def process_requests_content(content, redirect=True):
+def process_requests_content(content, redirect=True, iframe_cache=None):
     """
     Fetch content from a URL and extract the main text content.
+    Iframes already present in iframe_cache (src -> content) are not fetched again.
     """
     try:
         # Remove script content from the final content
         content = remove_script_content(content)
 
-        # Check iframe content in the response and send it instead
-        soup = BeautifulSoup(content, 'html.parser')
-        iframes = soup.find_all('iframe')
-
-        # Combine all iframe content into a single string
+        # Combine all iframe content into a single string (fetched concurrently, kept in page order)
         if redirect:
-            for iframe in iframes:
-                iframe_src = iframe.get('src')
-                if iframe_src and "googletagmanager" not in iframe_src:
-                    print_(f"Found iframe, fetching content from: {iframe_src}")
-                    content += f"<INLINE IFRAME SRC='{iframe_src}'>\n"
-                    iframe_content, _ = get_raw_requests(iframe_src)
-                    content += iframe_content
-                    content += f"</INLINE IFRAME>\n"
+            iframe_srcs = get_embedded_iframe_sources(content)
+            for iframe_src in iframe_srcs:
+                print_(f"Found iframe, fetching content from: {iframe_src}")
+            iframe_contents = dict(iframe_cache or {})
+            missing = [src for src in dict.fromkeys(iframe_srcs) if src not in iframe_contents]
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                    for iframe_src, (iframe_content, _) in zip(missing, executor.map(get_raw_requests, missing)):
+                        iframe_contents[iframe_src] = iframe_content
+            for iframe_src in iframe_srcs:
+                content += f"<INLINE IFRAME SRC='{iframe_src}'>\n"
+                content += iframe_contents[iframe_src]
+                content += f"</INLINE IFRAME>\n"
 
         return content
 
@@ -404,9 +531,15 @@ def process_requests_content(content, redirect=True):
         return ""
 
 
+# Converted Playwright cookies per cookie file, reused while the file's mtime is unchanged
+_playwright_cookie_cache = {}
+
+
 def load_cookies_for_playwright(cookie_path=COOKIE_PATH):
     """
     Load cookies from pickle file and convert them to Playwright format.
+    The conversion is cached until the cookie file changes; expired cookies are
+    filtered out on every call.
     
     Args:
     - cookie_path: Path to the pickle file containing cookies
@@ -415,43 +548,14 @@ def load_cookies_for_playwright(cookie_path=COOKIE_PATH):
     - list: List of cookie dictionaries in Playwright format, or empty list if failed
     """
     try:
-        with open(cookie_path, 'rb') as f:
-            requests_cookies = pickle.load(f)
-
-        # Convert requests cookies to Playwright format
-        playwright_cookies = []
-        for cookie in requests_cookies:
-            # Skip cookies with missing essential fields
-            if not cookie.name or not cookie.value or not cookie.domain:
-                continue
-
-            # Create base cookie structure
-            playwright_cookie = {
-                'name': cookie.name,
-                'value': cookie.value,
-                'domain': cookie.domain,
-                'path': cookie.path or '/',
-            }
+        mtime = os.path.getmtime(cookie_path)
+        cached = _playwright_cookie_cache.get(cookie_path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _convert_cookies_for_playwright(cookie_path))
+            _playwright_cookie_cache[cookie_path] = cached
 
-            # Add optional fields if they exist
-            if cookie.expires:
-                if cookie.expires < time.time():
-                    continue
-                playwright_cookie['expires'] = int(cookie.expires)
-            if hasattr(cookie, 'secure') and cookie.secure:
-                playwright_cookie['secure'] = True
-            if hasattr(cookie, 'httpOnly') and cookie.httpOnly:
-                playwright_cookie['httpOnly'] = True
-            if hasattr(cookie, '_rest'):
-                if cookie._rest.get("HttpOnly"):
-                    playwright_cookie['httpOnly'] = True
-                if 'SameSite' in cookie._rest:
-                    playwright_cookie['sameSite'] = cookie._rest['SameSite'].title()
-
-            playwright_cookies.append(playwright_cookie)
-
-        # print_(f"Loaded {len(playwright_cookies)} cookies for Playwright", "GREEN")
-        return playwright_cookies
+        now = time.time()
+        return [cookie for cookie in cached[1] if cookie.get('expires', now) >= now]
 
     except FileNotFoundError:
         print_(f"Cookie file not found at path: {cookie_path}", "YELLOW")
@@ -461,31 +565,171 @@ def load_cookies_for_playwright(cookie_path=COOKIE_PATH):
         return []
 
 
+def _convert_cookies_for_playwright(cookie_path):
+    """
+    Read the pickled requests cookie jar and convert every usable cookie to Playwright format.
+    Expired cookies are kept here; load_cookies_for_playwright filters them per call.
+    """
+    with open(cookie_path, 'rb') as f:
+        requests_cookies = pickle.load(f)
+
+    # Convert requests cookies to Playwright format
+    playwright_cookies = []
+    for cookie in requests_cookies:
+        # Skip cookies with missing essential fields
+        if not cookie.name or not cookie.value or not cookie.domain:
+            continue
+
+        # Create base cookie structure
+        playwright_cookie = {
+            'name': cookie.name,
+            'value': cookie.value,
+            'domain': cookie.domain,
+            'path': cookie.path or '/',
+        }
+
+        # Add optional fields if they exist
+        if cookie.expires:
+            playwright_cookie['expires'] = int(cookie.expires)
+        if hasattr(cookie, 'secure') and cookie.secure:
+            playwright_cookie['secure'] = True
+        if hasattr(cookie, 'httpOnly') and cookie.httpOnly:
+            playwright_cookie['httpOnly'] = True
+        if hasattr(cookie, '_rest'):
+            if cookie._rest.get("HttpOnly"):
+                playwright_cookie['httpOnly'] = True
+            if 'SameSite' in cookie._rest:
+                playwright_cookie['sameSite'] = cookie._rest['SameSite'].title()
+
+        playwright_cookies.append(playwright_cookie)
+
+    # print_(f"Loaded {len(playwright_cookies)} cookies for Playwright", "GREEN")
+    return playwright_cookies
+
+
+# Playwright's sync API is bound to the thread that started it, so a single long-lived
+# browser is owned by one worker thread and fetches from any thread are handed to it
+_playwright_queue = queue.Queue()
+_playwright_thread = None
+_playwright_thread_lock = threading.Lock()
+
+
+# Resources a job page's text never depends on; not downloading them speeds up loading
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+
+def _route_request(route):
+    """Abort requests for blocked resource types and let everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _fetch_page(browser, url):
+    """Load a URL in a fresh context of a running browser and return the page HTML."""
+    # Create browser context and add cookies
+    context = browser.new_context()
+    try:
+        context.route("**/*", _route_request)
+        # if 'linkedin.com' in url or 'handshake.com' in url:
+        #     cookies = load_cookies_for_playwright()
+        #     if cookies:
+        #         context.add_cookies(cookies)
+        page = context.new_page()
+        page.goto(url, timeout=7000, wait_until='domcontentloaded')
+        try:
+            # Return as soon as the page stops loading; 4 seconds is still the upper bound
+            page.wait_for_load_state('networkidle', timeout=4000)
+        except PlaywrightTimeoutError:
+            pass  # Pages with long-polling never go idle; use what has rendered so far
+        # Drop scripts in the page itself so they are never serialized back to Python
+        page.evaluate("() => document.querySelectorAll('script,noscript,style').forEach(n => n.remove())")
+        return page.content()
+    finally:
+        context.close()
+
+
+def _playwright_worker():
+    """
+    Serve fetch requests from _playwright_queue with one browser, launched on first use
+    and relaunched if it disconnects. A request without a URL only launches the browser;
+    a None request closes the browser and stops the worker.
+    """
+    playwright = browser = None
+    while True:
+        request = _playwright_queue.get()
+        if request is None:
+            break
+        url, future = request
+        try:
+            if browser is None or not browser.is_connected():
+                if playwright is None:
+                    playwright = sync_playwright().start()
+                browser = playwright.chromium.launch(channel=_PLAYWRIGHT_CHANNEL, headless=True)
+            future.set_result(_fetch_page(browser, url) if url is not None else None)
+        except Exception as e:
+            future.set_exception(e)
+
+    try:
+        if browser is not None:
+            browser.close()
+        if playwright is not None:
+            playwright.stop()
+    except Exception:
+        pass  # Shutting down anyway
+
+
+def _stop_playwright_worker():
+    """Close the shared browser at interpreter exit."""
+    if _playwright_thread is not None:
+        _playwright_queue.put(None)
+        _playwright_thread.join(timeout=5)
+
+
+def _submit_playwright_fetch(url):
+    """
+    Queue a URL for the Playwright worker thread, starting it on first use.
+
+    Args:
+        url: URL to fetch, or None to only make sure the browser is running
+
+    Returns:
+        Future resolving to the page HTML (None for a warm-up request)
+    """
+    global _playwright_thread
+    with _playwright_thread_lock:
+        if _playwright_thread is None:
+            _playwright_thread = threading.Thread(target=_playwright_worker, daemon=True)
+            _playwright_thread.start()
+            atexit.register(_stop_playwright_worker)
+    future = Future()
+    _playwright_queue.put((url, future))
+    return future
+
+
+def warm_up_playwright():
+    """
+    Launch the shared Playwright browser in the background without waiting for it,
+    so a later fetch_with_playwright does not pay the browser startup.
+    """
+    _submit_playwright_fetch(None)
+
+
 def fetch_with_playwright(url):
     """
     Fetch dynamic content using Playwright with cookie support.
+    The browser is launched once and reused; each fetch gets its own context.
     """
 
     print_("Attempting to fetch dynamic content with Playwright...", "YELLOW")
 
     try:
         print_("Using Playwright for dynamic content loading...")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(channel=_PLAYWRIGHT_CHANNEL, headless=True)
-            # Create browser context and add cookies
-            context = browser.new_context()
-            # if 'linkedin.com' in url or 'handshake.com' in url:
-            #     cookies = load_cookies_for_playwright()
-            #     if cookies:
-            #         context.add_cookies(cookies)
-            page = context.new_page()
-            page.goto(url, timeout=7000, wait_until='domcontentloaded')
-            page.wait_for_timeout(4000)  # 4 seconds should be enough for most job sites
-            content = page.content()
-            browser.close()
-            # Remove script content from the final content
-            content = remove_script_content(content)
-            return content
+        content = _submit_playwright_fetch(url).result()
+        # Remove script content from the final content
+        content = remove_script_content(content)
+        return content
     except Exception as e:
         print_(f"Playwright failed: {str(e)}", "RED")
         return ""
@@ -609,6 +853,109 @@ def process_validated_job_data(result, excel_manager, source="LLM Backend"):
     return True
 
 
+# Extraction results are cached on disk per URL (or per pasted page content, by hash)
+# to skip refetching and LLM calls
+LLM_CACHE_DIR_NAME = ".llm_cache"
+LLM_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def _get_llm_cache_path(url):
+    """Get the cache file path for a URL or page content, keyed together with the configured models."""
+    models = ",".join(service.get('model', '') for service in credential.API_SERVICES)
+    key = hashlib.blake2b(f"{url}|{models}".encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(credential.BACKUP_FOLDER_PATH, LLM_CACHE_DIR_NAME, f"{key}.json")
+
+
+def load_cached_job(url):
+    """
+    Load a previously extracted job for a URL if it is younger than LLM_CACHE_TTL.
+
+    Returns:
+        dict or None: Cached job data, or None if missing or expired
+    """
+    try:
+        cache_path = _get_llm_cache_path(url)
+        if time.time() - os.path.getmtime(cache_path) > LLM_CACHE_TTL:
+            return None
+        with open(cache_path, 'rb') as f:
+            return parse_job_info(f.read()).to_dict()
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_job(url, result):
+    """Save validated job data for a URL to the on-disk cache."""
+    try:
+        cache_path = _get_llm_cache_path(url)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(JobInfo.from_dict(result).model_dump_json())
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print_(f"Failed to cache extraction result: {e}", "YELLOW")
+
+
+def extract_job_from_url(url, start=0):
+    """
+    Fetch a job URL and extract validated job data, falling back to Playwright if needed.
+
+    Args:
+        url: Job posting URL
+        start: Index of the API service to try first
+
+    Returns:
+        dict or None: Validated job data, or None if extraction failed
+    """
+    result = load_cached_job(url)
+    if result:
+        print_(f"Using cached extraction result for this URL.", "GREEN")
+        return result
+
+    # First try with requests
+    print_(f"Fetching content from URL with requests...", "YELLOW")
+    fetched_raw_content, status_code = get_raw_requests(url)
+
+    if not fetched_raw_content:
+        print_(f"Failed to fetch webpage content with requests.", "RED")
+    else:
+        # Analyze the fetched content to see if we need Playwright
+        print_(f"Analyzing content validity...")
+        # The page already looks blocked or client-rendered, so the Playwright fallback is likely:
+        # start the browser now so its launch overlaps the iframe fetches in the analysis
+        # (the detection scan is handed to the analysis so the page is only scanned once)
+        detected = _DETECT_RE.search(fetched_raw_content) is not None
+        if status_code in BLOCK_STATUS or detected:
+            warm_up_playwright()
+        iframe_cache = {}
+        needs_playwright = analyze_content_for_playwright(fetched_raw_content, status_code,
+                                                          iframe_cache=iframe_cache, detected=detected)
+
+        if not needs_playwright:
+            # Content looks good, try to process it
+            print_(f"Processing content based on requests...")
+            webpage_content = process_requests_content(fetched_raw_content, iframe_cache=iframe_cache)
+            webpage_content = "URL: " + url + "\n" + webpage_content
+            result = validate_job_data(process_webpage_content(webpage_content, start), "LLM Backend")
+
+    # Playwright as fallback
+    if not result:
+        print_(f"Fetching content from URL with playwright...", "YELLOW")
+        fetched_content_pw = fetch_with_playwright(url)
+        if fetched_content_pw:
+            webpage_content = "URL: " + url + "\n" + fetched_content_pw
+            result = validate_job_data(process_webpage_content(webpage_content, start), "LLM Backend")
+        else:
+            print_(f"Failed to fetch webpage content with playwright.", "RED")
+
+    if not result:
+        print_(f"Failed to fetch webpage content with any method.", "RED")
+        return None
+
+    save_cached_job(url, result)
+    return result
+
+
 def handle_webpage_content(content, excel_manager):
     """
     Handle webpage content: process it and add to Excel if valid
@@ -622,46 +969,17 @@ def handle_webpage_content(content, excel_manager):
     if content.startswith('view-source:'):
         content = content[12:]  # Remove 'view-source:' prefix
 
-    def process_helper(content):
-        # Process through OpenAI
-        result = process_webpage_content(content)
-        return validate_job_data(result, "LLM Backend")
+    # Several URLs on one line are extracted concurrently
+    urls = content.split()
+    if len(urls) > 1 and all(u.startswith(('http://', 'https://')) for u in urls):
+        handle_multiple_urls(urls, excel_manager)
+        return
 
     # Check if content is a URL
     if content.startswith(('http://', 'https://')):
         url = content
-        result = None
-
-        # First try with requests
-        print_(f"Fetching content from URL with requests...", "YELLOW")
-        fetched_raw_content, status_code = get_raw_requests(url)
-
-        if not fetched_raw_content:
-            print_(f"Failed to fetch webpage content with requests.", "RED")
-        else:
-            # Analyze the fetched content to see if we need Playwright
-            print_(f"Analyzing content validity...")
-            needs_playwright = analyze_content_for_playwright(fetched_raw_content, status_code)
-
-            if not needs_playwright:
-                # Content looks good, try to process it
-                print_(f"Processing content based on requests...")
-                webpage_content = process_requests_content(fetched_raw_content)
-                webpage_content = "URL: " + url + "\n" + webpage_content
-                result = process_helper(webpage_content)
-
-        # Playwright as fallback
+        result = extract_job_from_url(url)
         if not result:
-            print_(f"Fetching content from URL with playwright...", "YELLOW")
-            fetched_content_pw = fetch_with_playwright(url)
-            if fetched_content_pw:
-                webpage_content = "URL: " + url + "\n" + fetched_content_pw
-                result = process_helper(webpage_content)
-            else:
-                print_(f"Failed to fetch webpage content with playwright.", "RED")
-
-        if not result:
-            print_(f"Failed to fetch webpage content with any method.", "RED")
             return
 
         # Backup URL to local storage using singlefile with job info
@@ -669,14 +987,44 @@ def handle_webpage_content(content, excel_manager):
         job_title = result.get('Job Title', '')
         backup_url_local_async(url, company, job_title)
     else:
-        result = process_helper(content)
-        if not result:
-            return
+        # Pasted content is cached by its hash, so re-submitting the same page skips the LLM
+        result = load_cached_job(content)
+        if result:
+            print_(f"Using cached extraction result for this content.", "GREEN")
+        else:
+            # Process through OpenAI
+            result = validate_job_data(process_webpage_content(content), "LLM Backend")
+            if not result:
+                return
+            save_cached_job(content, result)
 
     # Process the validated result
     process_validated_job_data(result, excel_manager, "LLM Backend")
 
 
+def handle_multiple_urls(urls, excel_manager):
+    """
+    Handle several job URLs: extract them concurrently, then add each to Excel in order.
+    Each worker starts with a different API service so requests spread across API keys.
+
+    Args:
+        urls: List of job posting URLs
+        excel_manager: ExcelManager instance
+    """
+    print_(f"Extracting {len(urls)} URLs concurrently ...")
+    max_workers = min(len(urls), max(len(credential.API_SERVICES), 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(extract_job_from_url, urls, range(len(urls))))
+
+    # Duplicate checks and appends stay sequential since they may prompt the user
+    for url, result in zip(urls, results):
+        print_(f"\n{url}")
+        if not result:
+            continue
+        backup_url_local_async(url, result.get('Company', ''), result.get('Job Title', ''))
+        process_validated_job_data(result, excel_manager, "LLM Backend")
+
+
 def handle_json_content(json_content, excel_manager):
     """
     Handle JSON input: parse and validate job data, then add to Excel if valid.
@@ -721,7 +1069,7 @@ def get_backup_directory():
     Creates the directory if it doesn't exist.
     """
     try:
-        backup_dir = BACKUP_FOLDER_PATH
+        backup_dir = credential.BACKUP_FOLDER_PATH
 
         # Create backup directory if it doesn't exist
         if not os.path.exists(backup_dir):
@@ -734,6 +1082,10 @@ def get_backup_directory():
         return None
 
 
+# Characters not allowed in backup file names
+_FN_SANITIZE_RE = re.compile(r'[^\w\-_.]')
+
+
 def generate_backup_filename(company, job_title, backup_dir):
     """
     Generate backup filename in format: company_jobtitle_currentdate_no.html
@@ -749,8 +1101,8 @@ def generate_backup_filename(company, job_title, backup_dir):
     """
     try:
         # Clean company and job title for filename
-        company_clean = re.sub(r'[^\w\-_.]', '_', company.strip()) if company else "unknown_company"
-        job_title_clean = re.sub(r'[^\w\-_.]', '_', job_title.strip()) if job_title else "unknown_job"
+        company_clean = _FN_SANITIZE_RE.sub('_', company.strip()) if company else "unknown_company"
+        job_title_clean = _FN_SANITIZE_RE.sub('_', job_title.strip()) if job_title else "unknown_job"
 
         # Get current date
         current_date = datetime.now().strftime("%Y%m%d")
@@ -759,17 +1111,19 @@ def generate_backup_filename(company, job_title, backup_dir):
         base_filename = f"{company_clean}_{job_title_clean}_{current_date}"
         filename = f"{base_filename}.html"
 
+        # Read the directory once instead of stat'ing each candidate name
+        with os.scandir(backup_dir) as entries:
+            existing = {entry.name for entry in entries if entry.name.startswith(base_filename)}
+
         # Check if file already exists
-        if not os.path.exists(os.path.join(backup_dir, filename)):
+        if filename not in existing:
             return filename
 
         # If duplicate exists, start adding numbers from 2
         no = 2
-        while True:
-            filename = f"{base_filename}_{no}.html"
-            if not os.path.exists(os.path.join(backup_dir, filename)):
-                return filename
+        while f"{base_filename}_{no}.html" in existing:
             no += 1
+        return f"{base_filename}_{no}.html"
 
     except Exception as e:
         print_(f"Error generating backup filename: {str(e)}", "YELLOW")
@@ -778,6 +1132,36 @@ def generate_backup_filename(company, job_title, backup_dir):
         return f"backup_{timestamp}.html"
 
 
+# Backups run on a small fixed set of daemon worker threads fed by a queue: concurrency is
+# bounded under bursts of URLs and, as before, pending backups never hold up program exit
+BACKUP_MAX_WORKERS = 4
+_backup_queue = queue.Queue()
+_backup_workers = []
+_backup_workers_lock = threading.Lock()
+
+
+def _backup_worker():
+    """Run queued backup jobs forever."""
+    while True:
+        job = _backup_queue.get()
+        try:
+            job()
+        except Exception as e:
+            print_(f"Local backup request failed: {str(e)}", "RED")  # keep the worker alive
+        finally:
+            _backup_queue.task_done()
+
+
+def _submit_backup(job):
+    """Queue a backup job, starting another worker if all existing ones may be busy."""
+    with _backup_workers_lock:
+        if len(_backup_workers) < BACKUP_MAX_WORKERS and _backup_queue.unfinished_tasks >= len(_backup_workers):
+            worker = threading.Thread(target=_backup_worker, name=f"backup-{len(_backup_workers) + 1}", daemon=True)
+            worker.start()
+            _backup_workers.append(worker)
+        _backup_queue.put(job)
+
+
 def backup_url_local_async(url, company="", job_title=""):
     """
     Asynchronously backup URL to local storage using singlefile.
@@ -815,6 +1199,4 @@ def backup_url_local_async(url, company="", job_title=""):
         except Exception as e:
             print_(f"Local backup request failed: {str(e)}", "RED")
 
-    thread = threading.Thread(target=_backup_request)
-    thread.daemon = True  # Set as daemon thread so it won't prevent program exit
-    thread.start()
+    _submit_backup(_backup_request)
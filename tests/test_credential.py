@@ -0,0 +1,88 @@
+import json
+import os
+
+import pytest
+
+from intelliapply.config import credential
+from intelliapply.config.credential import ConfigManager
+
+VALID_CONFIG = """
+api_services:
+  - api_key: "sk-test-key"
+    base_url: "https://api.example.com/v1/"
+    model: "test-model"
+paths:
+  excel_file_path: "{excel}"
+  backup_folder_path: "{backup}"
+"""
+
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch):
+    """Point HOME at a temp directory and forget any exports resolved by earlier tests."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    for name in credential._EXPORTED_NAMES:
+        monkeypatch.delitem(credential.__dict__, name, raising=False)
+    yield tmp_path
+    for name in credential._EXPORTED_NAMES:
+        credential.__dict__.pop(name, None)
+
+
+def write_config(home, text):
+    config_dir = home / ConfigManager.CONFIG_DIR_NAME
+    config_dir.mkdir(exist_ok=True)
+    config_file = config_dir / ConfigManager.CONFIG_FILE_NAME
+    config_file.write_text(text)
+    return config_file
+
+
+def valid_config(home, excel='jobs.xlsx'):
+    return VALID_CONFIG.format(excel=home / excel, backup=home / 'snapshots')
+
+
+def test_missing_config_raises_file_not_found(config_home):
+    with pytest.raises(FileNotFoundError):
+        credential.API_SERVICES
+
+
+def test_invalid_config_raises_value_error(config_home):
+    write_config(config_home, valid_config(config_home).replace('https://api.example.com/v1/', 'ftp://bad'))
+    with pytest.raises(ValueError, match='base_url is not a valid URL'):
+        credential.EXCEL_FILE_PATH
+
+
+def test_valid_config_resolves_exports(config_home):
+    write_config(config_home, valid_config(config_home))
+
+    assert credential.API_SERVICES[0]['model'] == 'test-model'
+    assert credential.EXCEL_FILE_PATH == str(config_home / 'jobs.xlsx')
+    assert credential.BACKUP_FOLDER_PATH == str(config_home / 'snapshots')
+
+
+def test_unknown_attribute_raises_attribute_error(config_home):
+    with pytest.raises(AttributeError):
+        credential.NOT_A_SETTING
+
+
+def test_sidecar_is_ignored_after_yaml_edit(config_home):
+    config_file = write_config(config_home, valid_config(config_home, 'old.xlsx'))
+    manager = ConfigManager()
+    assert manager.get_paths_config()['excel_file_path'] == str(config_home / 'old.xlsx')
+    assert manager.config_cache_file.exists()
+
+    # Edit the YAML and make sure its mtime moves even on coarse-grained filesystems
+    config_file.write_text(valid_config(config_home, 'new.xlsx'))
+    stat = os.stat(config_file)
+    os.utime(config_file, (stat.st_atime, stat.st_mtime + 5))
+
+    assert ConfigManager().get_paths_config()['excel_file_path'] == str(config_home / 'new.xlsx')
+    assert manager.get_paths_config()['excel_file_path'] == str(config_home / 'new.xlsx')
+
+
+def test_sidecar_with_matching_mtime_is_used(config_home):
+    config_file = write_config(config_home, valid_config(config_home))
+    manager = ConfigManager()
+    mtime = os.stat(config_file).st_mtime
+    manager.config_cache_file.write_text(json.dumps({'mtime': mtime, 'config': {'api_services': ['cached']}}))
+
+    assert manager.get_api_services() == ['cached']
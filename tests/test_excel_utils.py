@@ -0,0 +1,211 @@
+import re
+import zipfile
+
+import openpyxl
+import pytest
+from openpyxl.styles import Color, PatternFill
+
+from intelliapply.config.prompt import ALL_FIELDS
+from intelliapply.utils.excel_utils import ExcelManager
+
+HEADERS = ['Status'] + [field for field in ALL_FIELDS if field != 'Status']
+
+
+def make_row(company, title, **extra):
+    row = {field: '' for field in HEADERS if field != 'Status'}
+    row.update({'Company': company, 'Location': 'Remote', 'Job Title': title, 'Applied Date': '2024-01-01'})
+    row.update(extra)
+    return row
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(ExcelManager, 'DF_CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'jobs.xlsx'
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(HEADERS)
+    for row in (make_row('GlaxoSmithKline', 'Data Scientist'), make_row('Old Mission', 'Quant Trader')):
+        sheet.append([row.get(field, '') for field in HEADERS])
+    workbook.save(path)
+    manager = ExcelManager(str(path))
+    yield manager
+    manager.flush()
+
+
+def test_appended_row_is_searchable_before_reload(manager):
+    assert manager.search_applications('Acme') == []
+    manager.append_data_to_excel([make_row('Acme Robotics', 'Firmware Engineer')])
+
+    matches = manager.search_applications('Acme')
+    assert [match['Job Title'] for match in matches] == ['Firmware Engineer']
+    assert matches[0]['row_index'] == 4
+
+
+def test_appended_row_is_written_to_disk(manager):
+    manager.append_data_to_excel([make_row('Acme Robotics', 'Firmware Engineer')])
+    assert manager.flush()
+
+    reopened = ExcelManager(manager.file_path)
+    assert [match['Company'] for match in reopened.search_applications('Acme')] == ['Acme Robotics']
+
+
+def test_failed_merge_reloads_buffered_rows_from_disk(manager, monkeypatch):
+    manager.search_applications('warm up the cache')
+    manager.append_data_to_excel([make_row('Acme Robotics', 'Firmware Engineer')])
+
+    original = ExcelManager._flush_pending_rows
+    calls = []
+
+    def failing_merge(self):
+        calls.append(1)
+        if len(calls) == 1:
+            raise TypeError('incompatible categories')
+        return original(self)
+
+    monkeypatch.setattr(ExcelManager, '_flush_pending_rows', failing_merge)
+
+    matches = manager.search_applications('Acme')
+    assert [match['Job Title'] for match in matches] == ['Firmware Engineer']
+    assert manager._pending_rows == []
+    # Later calls don't hit the failure again
+    assert len(manager.search_applications('Old Mission')) == 1
+
+
+def companies(matches):
+    return sorted(match['Company'] for match in matches)
+
+
+@pytest.mark.parametrize('term, expected', [
+    ('GlaxoSmithKline', ['GlaxoSmithKline']),  # Direct match
+    ('glaxo', ['GlaxoSmithKline']),  # Company prefix
+    ('om', ['Old Mission']),  # Keyword is the company's abbreviation
+    ('OM', ['Old Mission']),  # Uppercase keyword is kept whole as its own abbreviation
+    ('Old Mansion', ['Old Mission']),  # Abbreviation of the keyword matches the company's
+    ('scientist', ['GlaxoSmithKline']),  # Single job title word (token index)
+    ('quant trader', ['Old Mission']),  # Multi-word job title phrase
+    ('trade', []),  # Title words match whole words only
+    ('zzz', []),
+])
+def test_search_index_matches(manager, term, expected):
+    assert companies(manager.search_applications(term)) == expected
+
+
+def test_search_index_is_rebuilt_after_append(manager):
+    assert companies(manager.search_applications('engineer')) == []
+    manager.append_data_to_excel([make_row('Acme Robotics', 'Firmware Engineer')])
+    assert companies(manager.search_applications('engineer')) == ['Acme Robotics']
+    assert companies(manager.search_applications('AR')) == ['Acme Robotics']
+
+
+def test_search_by_row_index(manager):
+    [match] = manager.search_applications(index=3)
+    assert (match['Company'], match['row_index']) == ('Old Mission', 3)
+
+
+def test_duplicate_check_matches_company_and_title(manager):
+    duplicate = manager.check_duplicate_entry({'Company': ' Old Mission ', 'Job Title': 'Quant Trader',
+                                               'Location': 'Somewhere else'})
+    assert duplicate is not None
+    assert (duplicate['Company'], duplicate['Job Title']) == ('Old Mission', 'Quant Trader')
+    assert list(duplicate.index) == ALL_FIELDS
+
+    assert manager.check_duplicate_entry({'Company': 'Old Mission', 'Job Title': 'Quant Researcher'}) is None
+    assert manager.check_duplicate_entry(None) is None
+
+
+def test_duplicate_check_sees_appended_rows(manager):
+    new_row = make_row('Acme Robotics', 'Firmware Engineer')
+    assert manager.check_duplicate_entry(new_row) is None
+    manager.append_data_to_excel([new_row])
+    assert manager.check_duplicate_entry(new_row)['Company'] == 'Acme Robotics'
+
+
+def write_status_workbook(path, fills):
+    """Save a sheet whose Status cells get the given fills (None: no fill), one data row each."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(HEADERS)
+    for idx, fill in enumerate(fills):
+        row = make_row(f'Company {idx}', 'Engineer')
+        sheet.append([row.get(field, '') for field in HEADERS])
+        if fill is not None:
+            sheet.cell(row=idx + 2, column=1).fill = fill
+    workbook.save(path)
+
+
+def solid(color):
+    return PatternFill(fill_type='solid', start_color=color, end_color=color)
+
+
+STATUS_FILLS = [
+    solid(ExcelManager.STATUS_COLORS['REJECTED']),
+    None,
+    solid(ExcelManager.STATUS_COLORS['PROCESSING']),
+    solid(ExcelManager.STATUS_COLORS['OFFER']),
+    solid('FF123456'),  # Some other color
+    PatternFill(fill_type='solid', start_color=Color(theme=4)),
+    PatternFill(fill_type='solid', start_color=Color(indexed=10)),
+]
+EXPECTED_STATUSES = ['REJECTED', 'NONE', 'PROCESSING', 'OFFER', 'NONE', 'NONE', 'NONE']
+
+
+def test_xml_status_scan_matches_openpyxl(manager):
+    write_status_workbook(manager.file_path, STATUS_FILLS)
+    row_count = len(STATUS_FILLS)
+
+    xml_colors = ExcelManager._read_status_colors_xml(manager.file_path, row_count)
+    openpyxl_colors = manager._read_status_colors(row_count)
+
+    assert xml_colors is not None
+    assert [manager._color_to_status(color) for color in xml_colors] == EXPECTED_STATUSES
+    assert [manager._color_to_status(color) for color in openpyxl_colors] == EXPECTED_STATUSES
+    # Plain RGB fills come back as the same ARGB strings either way
+    rgb_rows = [0, 2, 3, 4]
+    assert [xml_colors[i] for i in rgb_rows] == [openpyxl_colors[i] for i in rgb_rows]
+
+
+def test_statuses_fall_back_to_openpyxl_when_xml_scan_fails(manager, monkeypatch):
+    write_status_workbook(manager.file_path, STATUS_FILLS)
+    monkeypatch.setattr(ExcelManager, '_read_status_colors_xml', staticmethod(lambda file_path, row_count: None))
+
+    df = manager._read_excel_data()
+    assert list(df['_internal_status'].astype(str)) == EXPECTED_STATUSES
+
+
+def test_xml_status_scan_gives_up_without_styles_part(manager, tmp_path):
+    write_status_workbook(manager.file_path, STATUS_FILLS)
+    stripped = tmp_path / 'no_styles.xlsx'
+    with zipfile.ZipFile(manager.file_path) as source, zipfile.ZipFile(stripped, 'w') as target:
+        for item in source.infolist():
+            if item.filename != 'xl/styles.xml':
+                target.writestr(item, source.read(item.filename))
+
+    assert ExcelManager._read_status_colors_xml(str(stripped), len(STATUS_FILLS)) is None
+
+
+def test_xml_status_scan_reads_shared_string_headers(manager, tmp_path):
+    # openpyxl writes inline strings; Excel itself stores the header text in sharedStrings.xml
+    write_status_workbook(manager.file_path, STATUS_FILLS)
+    shared = tmp_path / 'shared.xlsx'
+    strings = []
+
+    def to_shared(match):
+        strings.append(match.group(2))
+        return f'{match.group(1)} t="s"><v>{len(strings) - 1}</v></c>'
+
+    with zipfile.ZipFile(manager.file_path) as source, zipfile.ZipFile(shared, 'w') as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == 'xl/worksheets/sheet1.xml':
+                data = re.sub(r'(<c r="[A-Z]+1"[^>]*?) t="inlineStr"><is><t>([^<]*)</t></is></c>',
+                              to_shared, data.decode()).encode()
+            target.writestr(item, data)
+        items = ''.join(f'<si><t>{text}</t></si>' for text in strings)
+        target.writestr('xl/sharedStrings.xml',
+                        '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                        f'{items}</sst>')
+
+    assert 'Status' in strings
+    colors = ExcelManager._read_status_colors_xml(str(shared), len(STATUS_FILLS))
+    assert [ExcelManager.COLOR_STATUSES.get(color, 'NONE') for color in colors] == EXPECTED_STATUSES
@@ -0,0 +1,36 @@
+from intelliapply.utils.string_utils import strip_html_tags
+
+
+def test_strips_flat_elements_comments_and_links():
+    html = '<p>a</p><script>var x = "<p>";</script><!-- note --><link rel="x"><style>p{}</style><p>b</p>'
+    assert strip_html_tags(html) == '<p>a</p><p>b</p>'
+
+
+def test_nested_same_name_elements_are_removed_whole():
+    html = '<p>keep</p><header><div><header>inner</header>TAIL</div></header><p>after</p>'
+    assert strip_html_tags(html) == '<p>keep</p><p>after</p>'
+
+
+def test_nested_svg_is_removed_whole():
+    html = 'A<svg><g><svg><path/></svg></g><text>T</text></svg>B'
+    assert strip_html_tags(html) == 'AB'
+
+
+def test_unclosed_script_and_style_are_removed_to_end():
+    assert strip_html_tags('<p>x</p><script>var a = 1;') == '<p>x</p>'
+    assert strip_html_tags('<p>x</p><style>p { color: red }') == '<p>x</p>'
+
+
+def test_unclosed_layout_element_and_comment_are_removed_to_end():
+    assert strip_html_tags('<p>x</p><nav><a>home</a>') == '<p>x</p>'
+    assert strip_html_tags('<p>x</p><!-- open comment') == '<p>x</p>'
+
+
+def test_script_content_is_not_scanned_for_tags():
+    html = '<script>document.write("<script></nav>")</script><p>job</p>'
+    assert strip_html_tags(html) == '<p>job</p>'
+
+
+def test_self_closing_stray_and_lookalike_tags():
+    html = '<svg/><p>a</p></footer><header-bar>kept</header-bar><NAV class="x">m</Nav >'
+    assert strip_html_tags(html) == '<p>a</p><header-bar>kept</header-bar>'